@@ -5,14 +5,18 @@ setup(
     version="1.0.0",
     description="Simulate historical stock investments",
     author="Your Name",
-    packages=find_packages(),
+    packages=find_packages(exclude=["tests", "tests.*"]),
     package_dir={"": "."},
-    py_modules=["src.cli", "src.fetcher", "src.simulator"],
+    include_package_data=False,
     install_requires=[
         "yfinance>=0.2.0",
         "click>=8.0.0",
         "pandas>=1.5.0",
+        "numpy>=1.23.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.0.0"],
+    },
     entry_points={
         "console_scripts": [
             "stock-sim=src.cli:cli",
@@ -0,0 +1,113 @@
+"""Persistent on-disk cache for fetched stock data."""
+
+import hashlib
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    import orjson  # Optional, several times faster than the json module
+except ImportError:
+    import json
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+else:
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+
+DEFAULT_CACHE_DIR = Path.home() / '.cache' / 'stock-sim'
+
+# Tickers matching this are used as directory names as-is; others are hashed
+_SAFE_NAME = re.compile(r'[A-Za-z0-9^=._-]+')
+
+
+def default_cache_dir() -> Path:
+    """Get the cache directory, overridable with the STOCK_SIM_CACHE_DIR environment variable."""
+    return Path(os.environ.get('STOCK_SIM_CACHE_DIR', DEFAULT_CACHE_DIR))
+
+
+class FileCache:
+    """
+    JSON file cache sharded by ticker and month.
+
+    Dated entries (keys like '2020-01-31') are stored in <root>/<TICKER>/<YYYY-MM>.json,
+    other entries (e.g. 'current') in <root>/<TICKER>/<key>.json. Each entry records
+    when it was stored so callers can apply a TTL on read.
+
+    Shards are replaced atomically, and unreadable or corrupt shards are treated
+    as empty so a bad file only costs a refetch.
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root else default_cache_dir()
+
+    def _shard_path(self, ticker: str, key: str) -> Path:
+        if not _SAFE_NAME.fullmatch(ticker) or ticker in ('.', '..'):
+            ticker = hashlib.md5(ticker.encode()).hexdigest()
+        shard = key[:7] if key[:4].isdigit() else key
+        return self.root / ticker / f"{shard}.json"
+
+    def _read_shard(self, path: Path) -> dict:
+        try:
+            shard = _loads(path.read_bytes())
+        except (OSError, ValueError):  # Missing, unreadable or corrupt
+            return {}
+        return shard if isinstance(shard, dict) else {}
+
+    def get(self, ticker: str, key: str, ttl: Optional[float] = None) -> Optional[Any]:
+        """
+        Look up a cached value.
+
+        Args:
+            ticker: Stock ticker symbol
+            key: Entry key (a YYYY-MM-DD date or a name like 'current')
+            ttl: Maximum age in seconds, or None for no expiry
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        entry = self._read_shard(self._shard_path(ticker, key)).get(key)
+        try:
+            if ttl is not None and time.time() - entry['timestamp'] > ttl:
+                return None
+            return entry['value']
+        except (KeyError, TypeError):  # Missing or malformed entry
+            return None
+
+    def set(self, ticker: str, key: str, value: Any) -> None:
+        """Store a JSON-serializable value. Write failures are ignored."""
+        self.set_many(ticker, {key: value})
+
+    def set_many(self, ticker: str, values: dict[str, Any]) -> None:
+        """Store several JSON-serializable values, writing each shard once. Write failures are ignored."""
+        shards: dict[Path, dict[str, Any]] = {}
+        for key, value in values.items():
+            shards.setdefault(self._shard_path(ticker, key), {})[key] = value
+
+        now = time.time()
+        for path, entries in shards.items():
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                shard = self._read_shard(path)
+                for key, value in entries.items():
+                    shard[key] = {'timestamp': now, 'value': value}
+
+                # Write to a temporary file and rename it into place, so readers
+                # never see a half-written shard
+                fd, tmp = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+                try:
+                    with os.fdopen(fd, 'wb') as f:
+                        f.write(_dumps(shard))
+                    os.replace(tmp, path)
+                except BaseException:
+                    os.unlink(tmp)
+                    raise
+            except OSError:
+                pass  # Caching is best-effort
@@ -1,16 +1,273 @@
 """Command-line interface for stock simulator."""
 
+import functools
 import sys
-from datetime import datetime
-from dateutil.relativedelta import relativedelta
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import Optional
 import click
 
-from .fetcher import get_stock_price, get_current_price, StockDataError
+from .fetcher import (
+    get_stock_price, get_current_price, get_company_name, get_stock_prices_bulk,
+    get_current_prices_bulk, get_price_series, closes_on_or_before, validate_ticker, StockDataError
+)
 from .simulator import (
-    simulate_investment, simulate_portfolio, rank_investments,
-    RankingResult, ScenarioResult, ComparisonResult, BenchmarkResult, DCAResult
+    simulate_investment, simulate_investments, simulate_portfolio, simulate_dca, rank_investments,
+    InvestmentResult, RankingResult, ScenarioResult, ComparisonResult, BenchmarkResult
 )
-from .visualizer import plot_stock_performance, plot_portfolio_comparison
+
+# Threads used for concurrent Yahoo Finance requests
+MAX_WORKERS = 8
+
+
+def _fetch_concurrently(calls: list[tuple]) -> list:
+    """
+    Run independent fetch calls in parallel threads.
+
+    Each call is a (function, *args) tuple. Results come back in the same order;
+    a call that raised StockDataError yields the exception instead of a result.
+    """
+    def run(call):
+        func, *args = call
+        try:
+            return func(*args)
+        except StockDataError as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        return list(pool.map(run, calls))
+
+
+def _fetch_buy_sell(ticker: str, buy_date: datetime, sell_dt: datetime, use_current: bool) -> tuple[float, str, float]:
+    """Fetch (buy_price, company_name, sell_price) for a ticker. Raises StockDataError."""
+    buy_price, company_name = get_stock_price(ticker, buy_date)
+    if use_current:
+        sell_price = get_current_price(ticker)
+    else:
+        sell_price, _ = get_stock_price(ticker, sell_dt)
+    return buy_price, company_name, sell_price
+
+
+def _fetch_series_and_current(ticker: str, start: datetime, end: datetime) -> tuple:
+    """
+    Fetch (closes, current_price) for a ticker, one after the other.
+
+    Both go through the ticker's shared yf.Ticker history(), which is not
+    thread-safe. A fetch that raised StockDataError yields the exception instead.
+    """
+    try:
+        closes = get_price_series(ticker, start, end)
+    except StockDataError as e:
+        return e, None
+    try:
+        return closes, get_current_price(ticker)
+    except StockDataError as e:
+        return closes, e
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_iso_date(value: str) -> datetime:
+    """Parse a YYYY-MM-DD date. Raises ValueError on invalid input."""
+    # fromisoformat is several times faster than strptime for the canonical form;
+    # strptime still handles unpadded input like 2020-1-5
+    if len(value) == 10 and value[4] == '-' and value[7] == '-':
+        return datetime.fromisoformat(value)
+    return datetime.strptime(value, '%Y-%m-%d')
+
+
+def _upper_ticker(ticker: str) -> str:
+    """Upper-case a ticker, skipping the string copy when it already is."""
+    return ticker if ticker.isascii() and ticker.isupper() else ticker.upper()
+
+
+def _parse_ticker(value: str) -> str:
+    """Upper-case and check a ticker symbol. Raises ValueError on malformed input."""
+    ticker = _upper_ticker(value)
+    if not validate_ticker(ticker):
+        raise ValueError(f"Invalid ticker '{value}'.")
+    return ticker
+
+
+def _parse_holding(value: str) -> tuple[str, float]:
+    """Parse a TICKER:AMOUNT holding into (ticker, amount). Raises ValueError on invalid input."""
+    ticker, sep, amount_str = value.partition(':')
+    if not sep or ':' in amount_str:
+        raise ValueError(f"Invalid holding format '{value}'. Use TICKER:AMOUNT.")
+    ticker = _upper_ticker(ticker)
+    if not validate_ticker(ticker):
+        raise ValueError(f"Invalid ticker in '{value}'.")
+    try:
+        amount = float(amount_str)
+    except ValueError:
+        raise ValueError(f"Invalid amount in '{value}'.")
+    if amount <= 0:
+        raise ValueError(f"Amount must be positive in '{value}'.")
+    return ticker, amount
+
+
+class DateType(click.ParamType):
+    """Click parameter type for YYYY-MM-DD dates."""
+    name = 'date'
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, datetime):
+            return value
+        try:
+            return _parse_iso_date(value)
+        except ValueError:
+            self.fail(f"Invalid date format '{value}'. Use YYYY-MM-DD.", param, ctx)
+
+
+class TickerType(click.ParamType):
+    """Click parameter type for ticker symbols, converted to upper case."""
+    name = 'ticker'
+
+    def convert(self, value, param, ctx):
+        try:
+            return _parse_ticker(value)
+        except ValueError as e:
+            self.fail(str(e), param, ctx)
+
+
+class HoldingType(click.ParamType):
+    """Click parameter type for TICKER:AMOUNT holdings, converted to (ticker, amount)."""
+    name = 'holding'
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, tuple):
+            return value
+        try:
+            return _parse_holding(value)
+        except ValueError as e:
+            self.fail(str(e), param, ctx)
+
+
+class ScenarioType(click.ParamType):
+    """Click parameter type for comma-separated holdings, converted to a list of (ticker, amount)."""
+    name = 'scenario'
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, list):
+            return value
+        try:
+            return [_parse_holding(h.strip()) for h in value.split(',')]
+        except ValueError as e:
+            self.fail(f"{e} (in scenario '{value}')", param, ctx)
+
+
+DATE = DateType()
+TICKER = TickerType()
+HOLDING = HoldingType()
+SCENARIO = ScenarioType()
+POSITIVE_AMOUNT = click.FloatRange(min=0, min_open=True)
+
+
+def _check_date_range(
+    start_dt: datetime,
+    end_dt: Optional[datetime],
+    now: datetime,
+    start_label: str = 'Buy',
+    end_label: str = 'Sell',
+) -> datetime:
+    """
+    Validate a start date and optional end date, returning the end date (defaulting to now).
+
+    Prints an error and exits on invalid input.
+    """
+    if start_dt > now:
+        click.echo(f"Error: {start_label} date cannot be in the future.", err=True)
+        sys.exit(1)
+
+    if end_dt is None:
+        return now
+
+    if end_dt < start_dt:
+        click.echo(f"Error: {end_label} date cannot be before {start_label.lower()} date.", err=True)
+        sys.exit(1)
+
+    return end_dt
+
+
+def _fetch_prices(
+    tickers: list[str],
+    buy_date: datetime,
+    sell_dt: datetime,
+    use_current: bool,
+) -> tuple[dict[str, float], dict[str, float]]:
+    """
+    Fetch buy and sell prices for all tickers with one batched download per date.
+
+    Only the week around each date is downloaded rather than the whole holding
+    period. Raises StockDataError.
+    """
+    buy_prices = get_stock_prices_bulk(tickers, buy_date)
+    if use_current:
+        sell_prices = get_current_prices_bulk(tickers)
+    else:
+        sell_prices = get_stock_prices_bulk(tickers, sell_dt)
+    return buy_prices, sell_prices
+
+
+def _lookup_prices(ticker: str, buy_prices: dict, sell_prices: dict) -> tuple[float, float]:
+    """Look up (buy_price, sell_price) in prefetched prices. Raises StockDataError."""
+    if ticker not in buy_prices or ticker not in sell_prices:
+        raise StockDataError(f"No data found for {ticker} around the buy or sell date. Check if the ticker is valid.")
+
+    return buy_prices[ticker], sell_prices[ticker]
+
+
+def _lookup_all_prices(
+    holdings: list[tuple[str, float]],
+    buy_prices: dict,
+    sell_prices: dict,
+) -> list[tuple[float, float]]:
+    """
+    Look up (buy_price, sell_price) for every (ticker, amount) holding.
+
+    Prints an error and exits on the first ticker without prices.
+    """
+    prices = []
+    for ticker, _ in holdings:
+        try:
+            prices.append(_lookup_prices(ticker, buy_prices, sell_prices))
+        except StockDataError as e:
+            click.echo(f"Error fetching {ticker}: {e}", err=True)
+            sys.exit(1)
+    return prices
+
+
+def _company_names(tickers: list[str]) -> list[str]:
+    """Look up the company name for each ticker."""
+    # Name lookups are one request per ticker, so run them side by side,
+    # once per ticker so no two threads share a ticker's yfinance state
+    unique = list(dict.fromkeys(tickers))
+    names = dict(zip(unique, _fetch_concurrently([(get_company_name, ticker) for ticker in unique])))
+    return [names[ticker] for ticker in tickers]
+
+
+def _simulate_holdings(
+    holdings: list[tuple[str, float]],
+    prices: list[tuple[float, float]],
+    buy_date: datetime,
+    sell_dt: datetime,
+    company_names: Optional[list[str]] = None,
+) -> list[InvestmentResult]:
+    """
+    Simulate each (ticker, amount) holding at its (buy_price, sell_price).
+
+    Company names are looked up unless given.
+    """
+    tickers = [ticker for ticker, _ in holdings]
+    return simulate_investments(
+        tickers=tickers,
+        company_names=_company_names(tickers) if company_names is None else company_names,
+        buy_date=buy_date,
+        buy_prices=[buy_price for buy_price, _ in prices],
+        sell_date=sell_dt,
+        sell_prices=[sell_price for _, sell_price in prices],
+        amounts=[amount for _, amount in holdings],
+    )
 
 
 @click.group()
@@ -21,65 +278,35 @@ def cli():
 
 
 @cli.command()
-@click.argument('ticker')
-@click.option('--date', '-d', required=True, help='Buy date (YYYY-MM-DD)')
-@click.option('--amount', '-a', required=True, type=float, help='Investment amount in dollars')
-@click.option('--sell-date', '-s', default=None, help='Sell date (YYYY-MM-DD). Defaults to today.')
+@click.argument('ticker', type=TICKER)
+@click.option('--date', '-d', required=True, type=DATE, help='Buy date (YYYY-MM-DD)')
+@click.option('--amount', '-a', required=True, type=POSITIVE_AMOUNT, help='Investment amount in dollars')
+@click.option('--sell-date', '-s', default=None, type=DATE, help='Sell date (YYYY-MM-DD). Defaults to today.')
 @click.option('--benchmark', '-b', is_flag=True, help='Compare against S&P 500 (SPY)')
-def simulate(ticker: str, date: str, amount: float, sell_date: str, benchmark: bool):
+def simulate(ticker: str, date: datetime, amount: float, sell_date: Optional[datetime], benchmark: bool):
     """
     Simulate a stock investment.
 
     Example: stock-sim simulate AAPL --date 2020-01-01 --amount 1000
     Example with benchmark: stock-sim simulate AAPL --date 2020-01-01 --amount 1000 --benchmark
     """
-    ticker = ticker.upper()
+    now = datetime.now()
 
-    # Parse buy date
-    try:
-        buy_date = datetime.strptime(date, '%Y-%m-%d')
-    except ValueError:
-        click.echo(f"Error: Invalid date format '{date}'. Use YYYY-MM-DD.", err=True)
-        sys.exit(1)
-
-    # Validate buy date
-    if buy_date > datetime.now():
-        click.echo("Error: Buy date cannot be in the future.", err=True)
-        sys.exit(1)
-
-    # Parse sell date
-    if sell_date:
-        try:
-            sell_dt = datetime.strptime(sell_date, '%Y-%m-%d')
-        except ValueError:
-            click.echo(f"Error: Invalid sell date format '{sell_date}'. Use YYYY-MM-DD.", err=True)
-            sys.exit(1)
-        if sell_dt < buy_date:
-            click.echo("Error: Sell date cannot be before buy date.", err=True)
-            sys.exit(1)
-    else:
-        sell_dt = datetime.now()
-
-    # Validate amount
-    if amount <= 0:
-        click.echo("Error: Investment amount must be positive.", err=True)
-        sys.exit(1)
+    buy_date = date
+    sell_dt = _check_date_range(buy_date, sell_date, now)
 
     click.echo(f"Fetching data for {ticker}...")
 
-    try:
-        # Get buy price
-        buy_price, company_name = get_stock_price(ticker, buy_date)
-
-        # Get sell price
-        if sell_date:
-            sell_price, _ = get_stock_price(ticker, sell_dt)
-        else:
-            sell_price = get_current_price(ticker)
+    # Fetch the stock and the SPY benchmark at the same time (once if they are the same)
+    symbols = list(dict.fromkeys([ticker, 'SPY'] if benchmark else [ticker]))
+    fetched = dict(zip(symbols, _fetch_concurrently([
+        (_fetch_buy_sell, symbol, buy_date, sell_dt, not sell_date) for symbol in symbols
+    ])))
 
-    except StockDataError as e:
-        click.echo(f"Error: {e}", err=True)
+    if isinstance(fetched[ticker], StockDataError):
+        click.echo(f"Error: {fetched[ticker]}", err=True)
         sys.exit(1)
+    buy_price, company_name, sell_price = fetched[ticker]
 
     # Run simulation
     result = simulate_investment(
@@ -93,14 +320,11 @@ def simulate(ticker: str, date: str, amount: float, sell_date: str, benchmark: b
     )
 
     if benchmark:
-        # Fetch SPY data for comparison
-        try:
-            spy_buy_price, spy_name = get_stock_price('SPY', buy_date)
-            if sell_date:
-                spy_sell_price, _ = get_stock_price('SPY', sell_dt)
-            else:
-                spy_sell_price = get_current_price('SPY')
-
+        if isinstance(fetched['SPY'], StockDataError):
+            click.echo(f"Warning: Could not fetch benchmark data: {fetched['SPY']}", err=True)
+            click.echo("\n" + "=" * 45 + "\n" + str(result) + "\n" + "=" * 45)
+        else:
+            spy_buy_price, spy_name, spy_sell_price = fetched['SPY']
             spy_result = simulate_investment(
                 ticker='SPY',
                 company_name=spy_name,
@@ -113,27 +337,18 @@ def simulate(ticker: str, date: str, amount: float, sell_date: str, benchmark: b
 
             benchmark_result = BenchmarkResult(investment=result, benchmark=spy_result)
             click.echo("\n" + str(benchmark_result))
-        except StockDataError as e:
-            click.echo(f"Warning: Could not fetch benchmark data: {e}", err=True)
-            click.echo("\n" + "=" * 45)
-            click.echo(str(result))
-            click.echo("=" * 45)
     else:
-        click.echo("\n" + "=" * 45)
-        click.echo(str(result))
-        click.echo("=" * 45)
+        click.echo("\n" + "=" * 45 + "\n" + str(result) + "\n" + "=" * 45)
 
 
 @cli.command()
-@click.argument('ticker')
+@click.argument('ticker', type=TICKER)
 def price(ticker: str):
     """
     Get the current price for a stock.
 
     Example: stock-sim price AAPL
     """
-    ticker = ticker.upper()
-
     try:
         current = get_current_price(ticker)
         click.echo(f"{ticker}: ${current:,.2f}")
@@ -143,10 +358,10 @@ def price(ticker: str):
 
 
 @cli.command()
-@click.argument('holdings', nargs=-1, required=True)
-@click.option('--date', '-d', required=True, help='Buy date (YYYY-MM-DD)')
-@click.option('--sell-date', '-s', default=None, help='Sell date (YYYY-MM-DD). Defaults to today.')
-def portfolio(holdings: tuple, date: str, sell_date: str):
+@click.argument('holdings', nargs=-1, required=True, type=HOLDING)
+@click.option('--date', '-d', required=True, type=DATE, help='Buy date (YYYY-MM-DD)')
+@click.option('--sell-date', '-s', default=None, type=DATE, help='Sell date (YYYY-MM-DD). Defaults to today.')
+def portfolio(holdings: tuple, date: datetime, sell_date: Optional[datetime]):
     """
     Simulate a portfolio of stocks.
 
@@ -154,150 +369,79 @@ def portfolio(holdings: tuple, date: str, sell_date: str):
 
     Example: stock-sim portfolio AAPL:1000 TSLA:500 --date 2020-01-01
     """
-    # Parse buy date
-    try:
-        buy_date = datetime.strptime(date, '%Y-%m-%d')
-    except ValueError:
-        click.echo(f"Error: Invalid date format '{date}'. Use YYYY-MM-DD.", err=True)
-        sys.exit(1)
+    now = datetime.now()
 
-    if buy_date > datetime.now():
-        click.echo("Error: Buy date cannot be in the future.", err=True)
-        sys.exit(1)
+    buy_date = date
+    sell_dt = _check_date_range(buy_date, sell_date, now)
 
-    # Parse sell date
-    if sell_date:
-        try:
-            sell_dt = datetime.strptime(sell_date, '%Y-%m-%d')
-        except ValueError:
-            click.echo(f"Error: Invalid sell date format '{sell_date}'. Use YYYY-MM-DD.", err=True)
-            sys.exit(1)
-        if sell_dt < buy_date:
-            click.echo("Error: Sell date cannot be before buy date.", err=True)
-            sys.exit(1)
-    else:
-        sell_dt = datetime.now()
+    click.echo(f"Fetching data for {len(holdings)} stocks...")
 
-    # Parse holdings
-    parsed = []
-    for h in holdings:
-        if ':' not in h:
-            click.echo(f"Error: Invalid holding format '{h}'. Use TICKER:AMOUNT.", err=True)
-            sys.exit(1)
-        parts = h.split(':')
-        if len(parts) != 2:
-            click.echo(f"Error: Invalid holding format '{h}'. Use TICKER:AMOUNT.", err=True)
-            sys.exit(1)
-        ticker = parts[0].upper()
-        try:
-            amount = float(parts[1])
-        except ValueError:
-            click.echo(f"Error: Invalid amount in '{h}'.", err=True)
-            sys.exit(1)
-        if amount <= 0:
-            click.echo(f"Error: Amount must be positive in '{h}'.", err=True)
-            sys.exit(1)
-        parsed.append((ticker, amount))
-
-    click.echo(f"Fetching data for {len(parsed)} stocks...")
+    try:
+        buy_prices, sell_prices = _fetch_prices([ticker for ticker, _ in holdings], buy_date, sell_dt, sell_date is None)
+    except StockDataError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
 
-    results = []
-    for ticker, amount in parsed:
-        try:
-            buy_price, company_name = get_stock_price(ticker, buy_date)
-            if sell_date:
-                sell_price, _ = get_stock_price(ticker, sell_dt)
-            else:
-                sell_price = get_current_price(ticker)
-
-            result = simulate_investment(
-                ticker=ticker,
-                company_name=company_name,
-                buy_date=buy_date,
-                buy_price=buy_price,
-                sell_date=sell_dt,
-                sell_price=sell_price,
-                investment_amount=amount,
-            )
-            results.append(result)
-        except StockDataError as e:
-            click.echo(f"Error fetching {ticker}: {e}", err=True)
-            sys.exit(1)
+    # Check every holding has prices before looking up any company names
+    prices = _lookup_all_prices(holdings, buy_prices, sell_prices)
+    results = _simulate_holdings(holdings, prices, buy_date, sell_dt)
 
     portfolio_result = simulate_portfolio(results, buy_date, sell_dt)
     click.echo("\n" + str(portfolio_result))
 
 
 @cli.command()
-@click.argument('tickers', nargs=-1, required=True)
-@click.option('--date', '-d', required=True, help='Buy date (YYYY-MM-DD)')
-@click.option('--sell-date', '-s', default=None, help='Sell date (YYYY-MM-DD). Defaults to today.')
-@click.option('--amount', '-a', default=1000.0, type=float, help='Investment amount (default: 1000)')
-@click.option('--top', '-t', default=10, type=int, help='Show top N results (default: 10)')
-def best(tickers: tuple, date: str, sell_date: str, amount: float, top: int):
+@click.argument('tickers', nargs=-1, required=True, type=TICKER)
+@click.option('--date', '-d', required=True, type=DATE, help='Buy date (YYYY-MM-DD)')
+@click.option('--sell-date', '-s', default=None, type=DATE, help='Sell date (YYYY-MM-DD). Defaults to today.')
+@click.option('--amount', '-a', default=1000.0, type=POSITIVE_AMOUNT, help='Investment amount (default: 1000)')
+@click.option('--top', '-t', default=10, type=click.IntRange(min=1), help='Show top N results (default: 10)')
+def best(tickers: tuple, date: datetime, sell_date: Optional[datetime], amount: float, top: int):
     """
     Find best performing stocks for a time period.
 
     Example: stock-sim best AAPL TSLA MSFT GOOGL NVDA --date 2020-01-01
     """
-    # Parse buy date
-    try:
-        buy_date = datetime.strptime(date, '%Y-%m-%d')
-    except ValueError:
-        click.echo(f"Error: Invalid date format '{date}'. Use YYYY-MM-DD.", err=True)
-        sys.exit(1)
+    now = datetime.now()
 
-    if buy_date > datetime.now():
-        click.echo("Error: Buy date cannot be in the future.", err=True)
-        sys.exit(1)
+    buy_date = date
+    sell_dt = _check_date_range(buy_date, sell_date, now)
 
-    # Parse sell date
-    if sell_date:
-        try:
-            sell_dt = datetime.strptime(sell_date, '%Y-%m-%d')
-        except ValueError:
-            click.echo(f"Error: Invalid sell date format '{sell_date}'. Use YYYY-MM-DD.", err=True)
-            sys.exit(1)
-        if sell_dt < buy_date:
-            click.echo("Error: Sell date cannot be before buy date.", err=True)
-            sys.exit(1)
-    else:
-        sell_dt = datetime.now()
-
-    tickers = [t.upper() for t in tickers]
     click.echo(f"Analyzing {len(tickers)} stocks...")
 
-    results = []
+    try:
+        buy_prices, sell_prices = _fetch_prices(tickers, buy_date, sell_dt, sell_date is None)
+    except StockDataError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
+
+    # Sort out tickers without prices before looking up any company names
+    found = []
+    prices = []
     failed = []
     for ticker in tickers:
         try:
-            buy_price, company_name = get_stock_price(ticker, buy_date)
-            if sell_date:
-                sell_price, _ = get_stock_price(ticker, sell_dt)
-            else:
-                sell_price = get_current_price(ticker)
-
-            result = simulate_investment(
-                ticker=ticker,
-                company_name=company_name,
-                buy_date=buy_date,
-                buy_price=buy_price,
-                sell_date=sell_dt,
-                sell_price=sell_price,
-                investment_amount=amount,
-            )
-            results.append(result)
+            prices.append(_lookup_prices(ticker, buy_prices, sell_prices))
+            found.append((ticker, amount))
         except StockDataError:
             failed.append(ticker)
 
     if failed:
         click.echo(f"Skipped (no data): {', '.join(failed)}")
 
-    if not results:
+    if not found:
         click.echo("Error: No valid stocks found.", err=True)
         sys.exit(1)
 
+    # Ranking only needs prices, so names (the slowest lookup) are only
+    # fetched for the rows that are shown
+    tickers = [ticker for ticker, _ in found]
+    results = _simulate_holdings(found, prices, buy_date, sell_dt, company_names=tickers)
     ranked = rank_investments(results)[:top]
+    ranked = [
+        replace(r, company_name=name)
+        for r, name in zip(ranked, _company_names([r.ticker for r in ranked]))
+    ]
     ranking_result = RankingResult(
         rankings=ranked,
         buy_date=buy_date,
@@ -308,10 +452,10 @@ def best(tickers: tuple, date: str, sell_date: str, amount: float, top: int):
 
 
 @cli.command()
-@click.argument('scenarios', nargs=-1, required=True)
-@click.option('--date', '-d', required=True, help='Buy date (YYYY-MM-DD)')
-@click.option('--sell-date', '-s', default=None, help='Sell date (YYYY-MM-DD). Defaults to today.')
-def compare(scenarios: tuple, date: str, sell_date: str):
+@click.argument('scenarios', nargs=-1, required=True, type=SCENARIO)
+@click.option('--date', '-d', required=True, type=DATE, help='Buy date (YYYY-MM-DD)')
+@click.option('--sell-date', '-s', default=None, type=DATE, help='Sell date (YYYY-MM-DD). Defaults to today.')
+def compare(scenarios: tuple, date: datetime, sell_date: Optional[datetime]):
     """
     Compare different investment scenarios.
 
@@ -319,84 +463,37 @@ def compare(scenarios: tuple, date: str, sell_date: str):
 
     Example: stock-sim compare "AAPL:1000,TSLA:500" "MSFT:800,GOOGL:700" --date 2020-01-01
     """
+    now = datetime.now()
+
     if len(scenarios) < 2:
         click.echo("Error: Need at least 2 scenarios to compare.", err=True)
         sys.exit(1)
 
-    # Parse buy date
-    try:
-        buy_date = datetime.strptime(date, '%Y-%m-%d')
-    except ValueError:
-        click.echo(f"Error: Invalid date format '{date}'. Use YYYY-MM-DD.", err=True)
-        sys.exit(1)
+    buy_date = date
+    sell_dt = _check_date_range(buy_date, sell_date, now)
 
-    if buy_date > datetime.now():
-        click.echo("Error: Buy date cannot be in the future.", err=True)
-        sys.exit(1)
+    click.echo(f"Comparing {len(scenarios)} scenarios...")
 
-    # Parse sell date
-    if sell_date:
-        try:
-            sell_dt = datetime.strptime(sell_date, '%Y-%m-%d')
-        except ValueError:
-            click.echo(f"Error: Invalid sell date format '{sell_date}'. Use YYYY-MM-DD.", err=True)
-            sys.exit(1)
-        if sell_dt < buy_date:
-            click.echo("Error: Sell date cannot be before buy date.", err=True)
-            sys.exit(1)
-    else:
-        sell_dt = datetime.now()
+    all_tickers = [ticker for scenario in scenarios for ticker, _ in scenario]
+    try:
+        buy_prices, sell_prices = _fetch_prices(all_tickers, buy_date, sell_dt, sell_date is None)
+    except StockDataError as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(1)
 
-    click.echo(f"Comparing {len(scenarios)} scenarios...")
+    # Check every scenario has prices before looking up any company names
+    scenario_prices = [_lookup_all_prices(scenario, buy_prices, sell_prices) for scenario in scenarios]
 
     scenario_results = []
-    for i, scenario_str in enumerate(scenarios, 1):
-        # Parse holdings from "AAPL:1000,TSLA:500" format
-        holdings_strs = scenario_str.split(',')
-        holdings = []
-
-        for h in holdings_strs:
-            h = h.strip()
-            if ':' not in h:
-                click.echo(f"Error: Invalid format '{h}' in scenario {i}. Use TICKER:AMOUNT.", err=True)
-                sys.exit(1)
-            parts = h.split(':')
-            if len(parts) != 2:
-                click.echo(f"Error: Invalid format '{h}' in scenario {i}. Use TICKER:AMOUNT.", err=True)
-                sys.exit(1)
-            ticker = parts[0].upper()
-            try:
-                amount = float(parts[1])
-            except ValueError:
-                click.echo(f"Error: Invalid amount in '{h}'.", err=True)
-                sys.exit(1)
-            if amount <= 0:
-                click.echo(f"Error: Amount must be positive in '{h}'.", err=True)
-                sys.exit(1)
-
-            try:
-                buy_price, company_name = get_stock_price(ticker, buy_date)
-                if sell_date:
-                    sell_price, _ = get_stock_price(ticker, sell_dt)
-                else:
-                    sell_price = get_current_price(ticker)
-
-                result = simulate_investment(
-                    ticker=ticker,
-                    company_name=company_name,
-                    buy_date=buy_date,
-                    buy_price=buy_price,
-                    sell_date=sell_dt,
-                    sell_price=sell_price,
-                    investment_amount=amount,
-                )
-                holdings.append(result)
-            except StockDataError as e:
-                click.echo(f"Error fetching {ticker}: {e}", err=True)
-                sys.exit(1)
-
-        total_invested = sum(h.investment_amount for h in holdings)
-        total_value = sum(h.final_value for h in holdings)
+    for i, (scenario, prices) in enumerate(zip(scenarios, scenario_prices), 1):
+        holdings = _simulate_holdings(scenario, prices, buy_date, sell_dt)
+
+        # Accumulate both totals in one pass over the holdings
+        total_invested = 0.0
+        total_value = 0.0
+        for h in holdings:
+            total_invested += h.investment_amount
+            total_value += h.final_value
         percent_return = ((total_value - total_invested) / total_invested) * 100 if total_invested > 0 else 0
 
         scenario_results.append(ScenarioResult(
@@ -416,37 +513,25 @@ def compare(scenarios: tuple, date: str, sell_date: str):
 
 
 @cli.command()
-@click.argument('tickers', nargs=-1, required=True)
-@click.option('--date', '-d', required=True, help='Start date (YYYY-MM-DD)')
-@click.option('--end-date', '-e', default=None, help='End date (YYYY-MM-DD). Defaults to today.')
-@click.option('--amount', '-a', default=1000.0, type=float, help='Investment amount (default: 1000)')
+@click.argument('tickers', nargs=-1, required=True, type=TICKER)
+@click.option('--date', '-d', required=True, type=DATE, help='Start date (YYYY-MM-DD)')
+@click.option('--end-date', '-e', default=None, type=DATE, help='End date (YYYY-MM-DD). Defaults to today.')
+@click.option('--amount', '-a', default=1000.0, type=POSITIVE_AMOUNT, help='Investment amount (default: 1000)')
 @click.option('--save', '-o', default=None, help='Save chart to file (e.g., chart.png)')
-def chart(tickers: tuple, date: str, end_date: str, amount: float, save: str):
+def chart(tickers: tuple, date: datetime, end_date: Optional[datetime], amount: float, save: str):
     """
     Visualize stock performance over time.
 
     Example: stock-sim chart AAPL TSLA MSFT --date 2020-01-01
     """
-    try:
-        start_dt = datetime.strptime(date, '%Y-%m-%d')
-    except ValueError:
-        click.echo(f"Error: Invalid date format '{date}'. Use YYYY-MM-DD.", err=True)
-        sys.exit(1)
+    now = datetime.now()
 
-    if start_dt > datetime.now():
-        click.echo("Error: Start date cannot be in the future.", err=True)
-        sys.exit(1)
+    start_dt = date
+    end_dt = _check_date_range(start_dt, end_date, now, start_label='Start', end_label='End')
 
-    if end_date:
-        try:
-            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-        except ValueError:
-            click.echo(f"Error: Invalid end date format '{end_date}'. Use YYYY-MM-DD.", err=True)
-            sys.exit(1)
-    else:
-        end_dt = datetime.now()
+    # Imported here so other commands don't pay for loading matplotlib
+    from .visualizer import plot_stock_performance
 
-    tickers = [t.upper() for t in tickers]
     click.echo(f"Generating chart for {len(tickers)} stocks...")
 
     plot_stock_performance(
@@ -459,100 +544,62 @@ def chart(tickers: tuple, date: str, end_date: str, amount: float, save: str):
 
 
 @cli.command()
-@click.argument('ticker')
-@click.option('--date', '-d', required=True, help='Start date (YYYY-MM-DD)')
-@click.option('--end-date', '-e', default=None, help='End date (YYYY-MM-DD). Defaults to today.')
-@click.option('--amount', '-a', default=500.0, type=float, help='Amount per month (default: 500)')
-def dca(ticker: str, date: str, end_date: str, amount: float):
+@click.argument('ticker', type=TICKER)
+@click.option('--date', '-d', required=True, type=DATE, help='Start date (YYYY-MM-DD)')
+@click.option('--end-date', '-e', default=None, type=DATE, help='End date (YYYY-MM-DD). Defaults to today.')
+@click.option('--amount', '-a', default=500.0, type=POSITIVE_AMOUNT, help='Amount per month (default: 500)')
+def dca(ticker: str, date: datetime, end_date: Optional[datetime], amount: float):
     """
     Simulate dollar-cost averaging (monthly investments).
 
     Example: stock-sim dca AAPL --date 2020-01-01 --amount 500
     """
-    ticker = ticker.upper()
+    now = datetime.now()
 
-    try:
-        start_dt = datetime.strptime(date, '%Y-%m-%d')
-    except ValueError:
-        click.echo(f"Error: Invalid date format '{date}'. Use YYYY-MM-DD.", err=True)
-        sys.exit(1)
-
-    if start_dt > datetime.now():
-        click.echo("Error: Start date cannot be in the future.", err=True)
-        sys.exit(1)
-
-    if end_date:
-        try:
-            end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-        except ValueError:
-            click.echo(f"Error: Invalid end date format '{end_date}'. Use YYYY-MM-DD.", err=True)
-            sys.exit(1)
-    else:
-        end_dt = datetime.now()
-
-    if amount <= 0:
-        click.echo("Error: Amount must be positive.", err=True)
-        sys.exit(1)
+    start_dt = date
+    end_dt = _check_date_range(start_dt, end_date, now, start_label='Start', end_label='End')
 
     click.echo(f"Simulating DCA for {ticker}...")
 
-    # Get company name
-    try:
-        _, company_name = get_stock_price(ticker, start_dt)
-    except StockDataError as e:
-        click.echo(f"Error: {e}", err=True)
-        sys.exit(1)
+    from dateutil.relativedelta import relativedelta
 
-    # Calculate purchases for each month
-    total_shares = 0.0
-    total_invested = 0.0
-    num_purchases = 0
+    # Collect monthly purchase dates
+    dates = []
     current_date = start_dt
-
     while current_date <= end_dt:
-        try:
-            price, _ = get_stock_price(ticker, current_date)
-            shares = amount / price
-            total_shares += shares
-            total_invested += amount
-            num_purchases += 1
-        except StockDataError:
-            pass  # Skip months with no data
-
+        dates.append(current_date)
         current_date = current_date + relativedelta(months=1)
 
-    if num_purchases == 0:
-        click.echo("Error: No valid purchase dates found.", err=True)
-        sys.exit(1)
+    # Fetch the company name alongside the price history and current price
+    # (starting a week early so a weekend/holiday first purchase finds a prior close)
+    (closes, current_price), company_name = _fetch_concurrently([
+        (_fetch_series_and_current, ticker, start_dt - timedelta(days=7), end_dt + timedelta(days=1)),
+        (get_company_name, ticker),
+    ])
 
-    # Get current price for final value
-    try:
-        current_price = get_current_price(ticker)
-    except StockDataError as e:
-        click.echo(f"Error getting current price: {e}", err=True)
+    if isinstance(closes, StockDataError):
+        click.echo(f"Error: {closes}", err=True)
         sys.exit(1)
 
-    final_value = total_shares * current_price
-    profit = final_value - total_invested
-    percent_return = (profit / total_invested) * 100 if total_invested > 0 else 0
-    avg_cost = total_invested / total_shares if total_shares > 0 else 0
+    if isinstance(current_price, StockDataError):
+        click.echo(f"Error getting current price: {current_price}", err=True)
+        sys.exit(1)
 
-    result = DCAResult(
+    # Months with no data come back as NaN and are skipped
+    result = simulate_dca(
         ticker=ticker,
         company_name=company_name,
         start_date=start_dt,
         end_date=end_dt,
         amount_per_period=amount,
-        num_purchases=num_purchases,
-        total_invested=total_invested,
-        total_shares=total_shares,
-        final_value=final_value,
-        profit=profit,
-        percent_return=percent_return,
-        avg_cost_per_share=avg_cost,
+        prices=closes_on_or_before(closes, dates),
         current_price=current_price,
     )
 
+    if result.num_purchases == 0:
+        click.echo("Error: No valid purchase dates found.", err=True)
+        sys.exit(1)
+
     click.echo("\n" + str(result))
 
 
@@ -1,8 +1,65 @@
 """Fetch historical stock data from Yahoo Finance."""
 
+from __future__ import annotations
+
+import functools
+import re
 from datetime import datetime, timedelta
-from typing import Optional
-import yfinance as yf
+from typing import TYPE_CHECKING, Optional
+import numpy as np
+
+from .cache import FileCache
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Symbols fetched in parallel by a batched download. The work is network-bound,
+# so this goes beyond yfinance's default of two threads per CPU.
+DOWNLOAD_THREADS = 32
+
+# Cache lifetimes in seconds. Historical closes are split/dividend adjusted by
+# Yahoo, so they can change after the fact and are only kept for a day.
+HISTORICAL_TTL = 24 * 60 * 60
+CURRENT_TTL = 60
+NAME_TTL = 30 * 24 * 60 * 60
+
+# Days after which Yahoo has published every bar, so a day with no bar is a
+# weekend or holiday rather than a bar still to come
+SETTLE_DAYS = 3
+
+# Upper-case Yahoo symbols: letters and digits with '.', '-' or '=' separators
+# (BRK.B, 0700.HK, BTC-USD, EURUSD=X), plus a leading '^' for indices (^GSPC)
+TICKER_PATTERN = re.compile(r'\^?[A-Z0-9][A-Z0-9.=-]{0,14}')
+
+_cache = FileCache()
+
+
+@functools.cache
+def _yf():
+    """
+    Import yfinance on first use.
+
+    yfinance pulls in pandas and its HTTP stack, which --help and runs served
+    from the disk cache never need.
+    """
+    import yfinance
+    return yfinance
+
+
+@functools.lru_cache(maxsize=256)
+def _ticker(ticker: str):
+    """
+    Get a shared yf.Ticker for a symbol.
+
+    Reusing the Ticker keeps its per-symbol state (exchange timezone, quote
+    metadata) across the price, name and current-price lookups instead of
+    fetching it again for each. Recent yfinance versions also send every request
+    through one process-wide session, so connections are pooled and kept alive.
+
+    Ticker.history() updates the instance without a lock, so callers that fetch
+    concurrently must keep each symbol's history lookups on one thread.
+    """
+    return _yf().Ticker(ticker)
 
 
 class StockDataError(Exception):
@@ -24,14 +81,19 @@ def get_stock_price(ticker: str, date: datetime) -> tuple[float, str]:
     Raises:
         StockDataError: If price cannot be fetched
     """
-    stock = yf.Ticker(ticker)
+    # Normalize to midnight so every time of day shares one memoized entry
+    return _get_stock_price(ticker, date.replace(hour=0, minute=0, second=0, microsecond=0))
 
-    # Get company name
-    try:
-        info = stock.info
-        company_name = info.get('shortName') or info.get('longName') or ticker
-    except Exception:
-        company_name = ticker
+
+@functools.lru_cache(maxsize=4096)
+def _get_stock_price(ticker: str, date: datetime) -> tuple[float, str]:
+    """Memoized get_stock_price. Errors propagate and are not cached."""
+    key = date.strftime('%Y-%m-%d')
+    cached = _cache.get(ticker, key, ttl=HISTORICAL_TTL)
+    if cached is not None:
+        return cached['price'], get_company_name(ticker)
+
+    stock = _ticker(ticker)
 
     # Fetch historical data (get a few days around target date for weekend handling)
     start_date = date - timedelta(days=7)
@@ -45,17 +107,290 @@ def get_stock_price(ticker: str, date: datetime) -> tuple[float, str]:
     if hist.empty:
         raise StockDataError(f"No data found for {ticker}. Check if the ticker is valid.")
 
-    # Find the closest date on or before the target date
     hist.index = hist.index.tz_localize(None)  # Remove timezone for comparison
-    available_dates = hist.index[hist.index <= date]
+    price = price_on_or_before(hist, ticker, date)
+    _cache_window(ticker, hist, date)
+
+    return price, get_company_name(ticker)
+
+
+def _cache_window(ticker: str, hist: pd.DataFrame, date: datetime) -> None:
+    """
+    Cache the on-or-before close for every day a fetched window settles.
+
+    A window fetched for a date also answers every earlier day back to its first
+    close, so lookups around the same date (weekends and holidays included) are
+    served from the cache without learning an exchange calendar.
+
+    A recent day is only settled once the window has a bar on or after it: a
+    missing bar may just not be published yet (or the exchange is behind the local
+    clock), and caching the previous close for it would serve a stale price until
+    the TTL ends. Today's bar is still moving, so it only settles the days before
+    it. Days more than SETTLE_DAYS old are settled either way.
+    """
+    today = datetime.now().date()
+    last_bar = hist.index[-1].date()
+    if last_bar >= today:
+        last_bar -= timedelta(days=1)
+    last = min(date.date(), max(last_bar, today - timedelta(days=SETTLE_DAYS)))
+    first = hist.index[0].date()
+    if first > last:
+        return
+
+    days = [datetime(first.year, first.month, first.day) + timedelta(days=i) for i in range((last - first).days + 1)]
+    closes = closes_on_or_before(hist['Close'], days)
+    _cache.set_many(ticker, {
+        day.strftime('%Y-%m-%d'): {'price': float(close)}
+        for day, close in zip(days, closes)
+        if not np.isnan(close)
+    })
+
+
+def get_company_name(ticker: str) -> str:
+    """
+    Get the display name for a ticker, falling back to the ticker itself.
 
-    if available_dates.empty:
+    Names are memoized and kept in the disk cache, since Ticker.info is the
+    slowest Yahoo request and names rarely change. Fallbacks are neither
+    memoized nor written to disk, so a failed lookup is retried next time.
+    """
+    try:
+        return _get_company_name(ticker)
+    except StockDataError:
+        return ticker
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_company_name(ticker: str) -> str:
+    """Memoized get_company_name. Raises StockDataError if there is no name; errors are not cached."""
+    cached = _cache.get(ticker, 'name', ttl=NAME_TTL)
+    if cached is not None:
+        return cached
+
+    try:
+        info = _ticker(ticker).info
+    except Exception as e:
+        raise StockDataError(f"Failed to fetch company name for {ticker}: {e}")
+
+    name = info.get('shortName') or info.get('longName')
+    if not name:
+        raise StockDataError(f"No company name found for {ticker}")
+
+    _cache.set(ticker, 'name', name)
+    return name
+
+
+def price_on_or_before(hist: pd.DataFrame, ticker: str, date: datetime) -> float:
+    """
+    Get the closing price from a price history on the closest date on or before a target date.
+
+    Args:
+        hist: Price history with a timezone-naive date index and a 'Close' column
+        ticker: Stock ticker symbol (used in error messages)
+        date: Target date
+
+    Returns:
+        Closing price
+
+    Raises:
+        StockDataError: If the history has no data on or before the date
+    """
+    # Binary search on the raw datetime64 values skips pandas' boolean mask and label lookup
+    pos = np.searchsorted(hist.index.values, np.datetime64(date), side='right') - 1
+
+    if pos < 0:
         raise StockDataError(f"No trading data available for {ticker} on or before {date.strftime('%Y-%m-%d')}")
 
-    closest_date = available_dates[-1]
-    price = hist.loc[closest_date, 'Close']
+    return float(hist['Close'].to_numpy()[pos])
+
+
+def get_prices_batch(tickers: list[str], start: datetime, end: datetime) -> dict[str, pd.DataFrame]:
+    """
+    Get daily price history for several stocks using batched downloads.
+
+    Args:
+        tickers: Stock ticker symbols
+        start: First date of the history
+        end: Date after the last date of the history
+
+    Returns:
+        Dict mapping ticker to its price history. Tickers with no data are left out.
+
+    Raises:
+        StockDataError: If a download fails
+    """
+    return _download_batch(tickers, start=start, end=end)
+
+
+def _download_batch(tickers: list[str], **window) -> dict[str, pd.DataFrame]:
+    """Batch-download history for tickers over a yf.download window (start/end or period)."""
+    import pandas as pd
+
+    tickers = list(dict.fromkeys(tickers))  # Drop duplicates, keep order
+    if not tickers:
+        return {}
 
-    return float(price), company_name
+    # One call for every symbol: yfinance fetches each symbol on its own
+    # connection, so splitting the list would only serialize the batches
+    try:
+        data = _yf().download(
+            tickers=" ".join(tickers),
+            group_by='ticker',
+            threads=min(len(tickers), DOWNLOAD_THREADS),
+            auto_adjust=True,  # Match Ticker.history; older yfinance defaults to raw closes
+            progress=False,
+            **window,
+        )
+    except Exception as e:
+        raise StockDataError(f"Failed to fetch data for {', '.join(tickers)}: {e}")
+
+    if data is None or data.empty:
+        return {}
+
+    histories = {}
+    for ticker in tickers:
+        if isinstance(data.columns, pd.MultiIndex):
+            if ticker not in data.columns.get_level_values(0):
+                continue
+            hist = data[ticker]
+        else:
+            hist = data  # Older yfinance returns flat columns for a single ticker
+
+        hist = hist.dropna(subset=['Close'])
+        if hist.empty:
+            continue
+
+        if hist.index.tz is not None:
+            hist.index = hist.index.tz_localize(None)
+        histories[ticker] = hist
+
+    return histories
+
+
+def get_stock_prices_bulk(tickers: list[str], date: datetime) -> dict[str, float]:
+    """
+    Get the closing prices for several stocks on a given date with one batched download.
+
+    Like get_stock_price, falls back to the closest prior trading day within a week.
+
+    Args:
+        tickers: Stock ticker symbols
+        date: Target date
+
+    Returns:
+        Dict mapping ticker to its closing price. Tickers with no price are left out.
+
+    Raises:
+        StockDataError: If a download fails
+    """
+    key = date.strftime('%Y-%m-%d')
+    prices = {}
+    missing = []
+    for ticker in dict.fromkeys(tickers):
+        cached = _cache.get(ticker, key, ttl=HISTORICAL_TTL)
+        if cached is not None:
+            prices[ticker] = cached['price']
+        else:
+            missing.append(ticker)
+
+    if not missing:
+        return prices
+
+    histories = get_prices_batch(missing, date - timedelta(days=7), date + timedelta(days=1))
+
+    for ticker, hist in histories.items():
+        try:
+            prices[ticker] = price_on_or_before(hist, ticker, date)
+        except StockDataError:
+            continue
+        _cache_window(ticker, hist, date)
+    return prices
+
+
+def get_current_prices_bulk(tickers: list[str]) -> dict[str, float]:
+    """
+    Get the current/latest prices for several stocks with one batched download.
+
+    Args:
+        tickers: Stock ticker symbols
+
+    Returns:
+        Dict mapping ticker to its latest price. Tickers with no price are left out.
+
+    Raises:
+        StockDataError: If a download fails
+    """
+    prices = {}
+    missing = []
+    for ticker in dict.fromkeys(tickers):
+        cached = _cache.get(ticker, 'current', ttl=CURRENT_TTL)
+        if cached is not None:
+            prices[ticker] = cached
+        else:
+            missing.append(ticker)
+
+    if not missing:
+        return prices
+
+    for ticker, hist in _download_batch(missing, period='5d').items():
+        prices[ticker] = float(hist['Close'].iloc[-1])
+        _cache.set(ticker, 'current', prices[ticker])
+    return prices
+
+
+def get_price_series(ticker: str, start: datetime, end: datetime) -> pd.Series:
+    """
+    Get daily closing prices for a stock over a date range.
+
+    Args:
+        ticker: Stock ticker symbol
+        start: First date of the range
+        end: Date after the last date of the range
+
+    Returns:
+        Closing prices indexed by (timezone-naive) date
+
+    Raises:
+        StockDataError: If prices cannot be fetched
+    """
+    stock = _ticker(ticker)
+
+    try:
+        hist = stock.history(start=start, end=end)
+    except Exception as e:
+        raise StockDataError(f"Failed to fetch data for {ticker}: {e}")
+
+    if hist.empty:
+        raise StockDataError(f"No data found for {ticker}. Check if the ticker is valid.")
+
+    hist.index = hist.index.tz_localize(None)
+    return hist['Close']
+
+
+def closes_on_or_before(closes: pd.Series, dates: list[datetime], max_gap: int = 7) -> np.ndarray:
+    """
+    Look up the closest close on or before each date.
+
+    Args:
+        closes: Closing prices indexed by (timezone-naive) date
+        dates: Dates to look up
+        max_gap: Maximum number of days to look back, matching get_stock_price's window
+
+    Returns:
+        Closing price for each date (NaN where there is none within max_gap days)
+    """
+    import pandas as pd
+
+    targets = pd.DatetimeIndex(dates)
+
+    # Position of the last close on or before each date (-1 if none)
+    pos = closes.index.searchsorted(targets, side='right') - 1
+    found = np.maximum(pos, 0)
+
+    prices = closes.to_numpy(dtype=np.float64)[found]
+    prices[(pos < 0) | (targets - closes.index[found] > pd.Timedelta(days=max_gap))] = np.nan
+
+    return prices
 
 
 def get_current_price(ticker: str) -> float:
@@ -71,7 +406,11 @@ def get_current_price(ticker: str) -> float:
     Raises:
         StockDataError: If price cannot be fetched
     """
-    stock = yf.Ticker(ticker)
+    cached = _cache.get(ticker, 'current', ttl=CURRENT_TTL)
+    if cached is not None:
+        return cached
+
+    stock = _ticker(ticker)
 
     try:
         hist = stock.history(period='5d')
@@ -81,14 +420,11 @@ def get_current_price(ticker: str) -> float:
     if hist.empty:
         raise StockDataError(f"No current data found for {ticker}")
 
-    return float(hist['Close'].iloc[-1])
+    price = float(hist['Close'].iloc[-1])
+    _cache.set(ticker, 'current', price)
+    return price
 
 
 def validate_ticker(ticker: str) -> bool:
-    """Check if a ticker symbol is valid."""
-    try:
-        stock = yf.Ticker(ticker)
-        hist = stock.history(period='1d')
-        return not hist.empty
-    except Exception:
-        return False
+    """Check if a ticker symbol is well-formed, without a network request."""
+    return TICKER_PATTERN.fullmatch(ticker) is not None
@@ -1,11 +1,17 @@
 """Investment simulation calculations."""
 
+import math
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+import numpy as np
 
-@dataclass
+# Below this many results, plain Python loops beat building NumPy arrays
+NUMPY_MIN_SIZE = 32
+
+
+@dataclass(slots=True)
 class InvestmentResult:
     """Results of an investment simulation."""
     ticker: str
@@ -23,24 +29,34 @@ class InvestmentResult:
 
     def __str__(self) -> str:
         """Format results for display."""
-        lines = [
-            f"Stock: {self.ticker} ({self.company_name})",
-            f"Buy Date: {self.buy_date.strftime('%Y-%m-%d')} @ ${self.buy_price:,.2f}",
-            f"Sell Date: {self.sell_date.strftime('%Y-%m-%d')} @ ${self.sell_price:,.2f}",
-            f"Shares: {self.shares:,.4f}",
-            "",
-            f"Investment: ${self.investment_amount:,.2f} -> ${self.final_value:,.2f}",
-        ]
-
-        # Format return with color indicator
         sign = "+" if self.profit >= 0 else ""
-        lines.append(f"Return: {sign}${self.profit:,.2f} ({sign}{self.percent_return:.1f}%)")
-
+        annualized = ""
         if self.annualized_return is not None:
-            sign = "+" if self.annualized_return >= 0 else ""
-            lines.append(f"Annualized: {sign}{self.annualized_return:.1f}%")
-
-        return "\n".join(lines)
+            annualized_sign = "+" if self.annualized_return >= 0 else ""
+            annualized = f"\nAnnualized: {annualized_sign}{self.annualized_return:.1f}%"
+
+        # One f-string builds the whole block without an intermediate list
+        return (
+            f"Stock: {self.ticker} ({self.company_name})\n"
+            f"Buy Date: {self.buy_date:%Y-%m-%d} @ ${self.buy_price:,.2f}\n"
+            f"Sell Date: {self.sell_date:%Y-%m-%d} @ ${self.sell_price:,.2f}\n"
+            f"Shares: {self.shares:,.4f}\n"
+            "\n"
+            f"Investment: ${self.investment_amount:,.2f} -> ${self.final_value:,.2f}\n"
+            f"Return: {sign}${self.profit:,.2f} ({sign}{self.percent_return:.1f}%)"
+            f"{annualized}"
+        )
+
+
+def _annualized_return(total_return: float, days_held: int) -> Optional[float]:
+    """Annualized percent return for a total return multiple, or None if held under ~4 days."""
+    years_held = days_held / 365.25
+    if years_held < 0.01:
+        return None
+    if total_return <= 0:
+        return -100.0  # Everything lost
+    # exp/log skips the generic float power path of pow()
+    return (math.exp(math.log(total_return) / years_held) - 1) * 100
 
 
 def simulate_investment(
@@ -77,17 +93,8 @@ def simulate_investment(
     profit = final_value - investment_amount
     percent_return = (profit / investment_amount) * 100
 
-    # Calculate annualized return if more than 1 day
     days_held = (sell_date - buy_date).days
-    if days_held > 0:
-        years_held = days_held / 365.25
-        if years_held >= 0.01:  # At least ~4 days
-            total_return = final_value / investment_amount
-            annualized_return = (pow(total_return, 1 / years_held) - 1) * 100
-        else:
-            annualized_return = None
-    else:
-        annualized_return = None
+    annualized_return = _annualized_return(final_value / investment_amount, days_held)
 
     return InvestmentResult(
         ticker=ticker,
@@ -105,7 +112,82 @@ def simulate_investment(
     )
 
 
-@dataclass
+def simulate_investments_batch(
+    buy_prices: np.ndarray,
+    sell_prices: np.ndarray,
+    amounts: np.ndarray,
+    days_held,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized simulate_investment math for many investments at once.
+
+    Args:
+        buy_prices: Price per share at purchase
+        sell_prices: Price per share at sale
+        amounts: Amount invested in dollars
+        days_held: Days between purchase and sale (one value, or one per investment)
+
+    Returns:
+        Tuple of (shares, final_value, profit, percent_return, annualized_return) arrays.
+        annualized_return is NaN where simulate_investment would give None.
+    """
+    buy_prices = np.asarray(buy_prices, dtype=np.float64)
+    sell_prices = np.asarray(sell_prices, dtype=np.float64)
+    amounts = np.asarray(amounts, dtype=np.float64)
+
+    shares = amounts / buy_prices
+    final_value = shares * sell_prices
+    profit = final_value - amounts
+    percent_return = (profit / amounts) * 100
+
+    years_held = np.asarray(days_held, dtype=np.float64) / 365.25
+    total_return = final_value / amounts
+    with np.errstate(divide='ignore', invalid='ignore'):  # Losses and short periods are masked out below
+        annualized = (np.exp(np.log(total_return) / years_held) - 1) * 100
+    annualized = np.where(total_return > 0, annualized, -100.0)
+    annualized = np.where(years_held >= 0.01, annualized, np.nan)
+
+    return shares, final_value, profit, percent_return, annualized
+
+
+def simulate_investments(
+    tickers: list[str],
+    company_names: list[str],
+    buy_date: datetime,
+    buy_prices: list[float],
+    sell_date: datetime,
+    sell_prices: list[float],
+    amounts: list[float],
+) -> list[InvestmentResult]:
+    """
+    Simulate several investments over the same period in one vectorized pass.
+
+    Takes the same arguments as simulate_investment, with one list entry per
+    investment, and gives the same results.
+    """
+    columns = simulate_investments_batch(buy_prices, sell_prices, amounts, (sell_date - buy_date).days)
+    shares, final_value, profit, percent_return, annualized = (c.tolist() for c in columns)
+
+    return [
+        InvestmentResult(
+            ticker=tickers[i],
+            company_name=company_names[i],
+            buy_date=buy_date,
+            buy_price=buy_prices[i],
+            sell_date=sell_date,
+            sell_price=sell_prices[i],
+            investment_amount=amounts[i],
+            shares=shares[i],
+            final_value=final_value[i],
+            profit=profit[i],
+            percent_return=percent_return[i],
+            annualized_return=None if math.isnan(annualized[i]) else annualized[i],
+        )
+        for i in range(len(tickers))
+    ]
+
+
+@dataclass(slots=True)
 class PortfolioResult:
     """Results of a portfolio simulation."""
     holdings: list[InvestmentResult] = field(default_factory=list)
@@ -125,7 +207,7 @@ class PortfolioResult:
             lines.append(f"{h.ticker}: ${h.investment_amount:,.0f} -> ${h.final_value:,.0f} ({sign}{h.percent_return:.1f}%)")
 
         lines.append("=" * 45)
-        lines.append(f"Period: {self.buy_date.strftime('%Y-%m-%d')} to {self.sell_date.strftime('%Y-%m-%d')}")
+        lines.append(f"Period: {self.buy_date:%Y-%m-%d} to {self.sell_date:%Y-%m-%d}")
         lines.append(f"Total Invested: ${self.total_invested:,.2f}")
         lines.append(f"Final Value: ${self.total_value:,.2f}")
 
@@ -145,21 +227,22 @@ def simulate_portfolio(
     sell_date: datetime,
 ) -> PortfolioResult:
     """Calculate portfolio totals from individual holdings."""
-    total_invested = sum(h.investment_amount for h in holdings)
-    total_value = sum(h.final_value for h in holdings)
+    if len(holdings) < NUMPY_MIN_SIZE:
+        # Accumulate both totals in one pass over the holdings
+        total_invested = 0.0
+        total_value = 0.0
+        for h in holdings:
+            total_invested += h.investment_amount
+            total_value += h.final_value
+    else:
+        count = len(holdings)
+        total_invested = float(np.fromiter((h.investment_amount for h in holdings), dtype=np.float64, count=count).sum())
+        total_value = float(np.fromiter((h.final_value for h in holdings), dtype=np.float64, count=count).sum())
     total_profit = total_value - total_invested
     percent_return = (total_profit / total_invested) * 100 if total_invested > 0 else 0
 
     days_held = (sell_date - buy_date).days
-    if days_held > 0:
-        years_held = days_held / 365.25
-        if years_held >= 0.01:
-            total_return = total_value / total_invested
-            annualized_return = (pow(total_return, 1 / years_held) - 1) * 100
-        else:
-            annualized_return = None
-    else:
-        annualized_return = None
+    annualized_return = _annualized_return(total_value / total_invested, days_held) if total_invested > 0 else None
 
     return PortfolioResult(
         holdings=holdings,
@@ -173,7 +256,7 @@ def simulate_portfolio(
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class RankingResult:
     """Ranked list of investments by performance."""
     rankings: list[InvestmentResult] = field(default_factory=list)
@@ -184,7 +267,7 @@ class RankingResult:
     def __str__(self) -> str:
         lines = [
             "BEST INVESTMENTS",
-            f"Period: {self.buy_date.strftime('%Y-%m-%d')} to {self.sell_date.strftime('%Y-%m-%d')}",
+            f"Period: {self.buy_date:%Y-%m-%d} to {self.sell_date:%Y-%m-%d}",
             f"Investment: ${self.amount:,.0f} each",
             "=" * 50,
             f"{'Rank':<5} {'Ticker':<8} {'Return':>12} {'Final Value':>14}",
@@ -204,11 +287,16 @@ class RankingResult:
 
 
 def rank_investments(results: list[InvestmentResult]) -> list[InvestmentResult]:
-    """Sort investments by percent return, highest first."""
-    return sorted(results, key=lambda r: r.percent_return, reverse=True)
+    """Sort investments by percent return, highest first (ties keep their input order)."""
+    if len(results) < NUMPY_MIN_SIZE:
+        return sorted(results, key=lambda r: r.percent_return, reverse=True)
 
+    returns = np.fromiter((r.percent_return for r in results), dtype=np.float64, count=len(results))
+    order = np.argsort(-returns, kind='stable')
+    return [results[i] for i in order]
 
-@dataclass
+
+@dataclass(slots=True)
 class ScenarioResult:
     """Result of a single scenario."""
     name: str
@@ -218,7 +306,7 @@ class ScenarioResult:
     percent_return: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ComparisonResult:
     """Comparison of multiple investment scenarios."""
     scenarios: list[ScenarioResult] = field(default_factory=list)
@@ -228,7 +316,7 @@ class ComparisonResult:
     def __str__(self) -> str:
         lines = [
             "SCENARIO COMPARISON",
-            f"Period: {self.buy_date.strftime('%Y-%m-%d')} to {self.sell_date.strftime('%Y-%m-%d')}",
+            f"Period: {self.buy_date:%Y-%m-%d} to {self.sell_date:%Y-%m-%d}",
             "=" * 55,
         ]
 
@@ -256,7 +344,7 @@ def compare_scenarios(scenarios: list[ScenarioResult]) -> list[ScenarioResult]:
     return sorted(scenarios, key=lambda s: s.percent_return, reverse=True)
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkResult:
     """Comparison of an investment against S&P 500 (SPY)."""
     investment: InvestmentResult
@@ -268,7 +356,7 @@ class BenchmarkResult:
 
         lines = [
             f"Stock: {inv.ticker} ({inv.company_name})",
-            f"Period: {inv.buy_date.strftime('%Y-%m-%d')} to {inv.sell_date.strftime('%Y-%m-%d')}",
+            f"Period: {inv.buy_date:%Y-%m-%d} to {inv.sell_date:%Y-%m-%d}",
             f"Investment: ${inv.investment_amount:,.2f}",
             "",
             "=" * 50,
@@ -294,7 +382,7 @@ class BenchmarkResult:
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class DCAResult:
     """Results of a dollar-cost averaging simulation."""
     ticker: str
@@ -316,7 +404,7 @@ class DCAResult:
             "DOLLAR-COST AVERAGING SIMULATION",
             "=" * 50,
             f"Stock: {self.ticker} ({self.company_name})",
-            f"Period: {self.start_date.strftime('%Y-%m-%d')} to {self.end_date.strftime('%Y-%m-%d')}",
+            f"Period: {self.start_date:%Y-%m-%d} to {self.end_date:%Y-%m-%d}",
             f"Investment: ${self.amount_per_period:,.0f}/month x {self.num_purchases} months",
             "",
             f"Total Invested: ${self.total_invested:,.2f}",
@@ -332,3 +420,59 @@ class DCAResult:
         lines.append("=" * 50)
 
         return "\n".join(lines)
+
+
+def _dca_kernel(prices: np.ndarray, amount: float) -> tuple[float, float, int]:
+    """Accumulate (total_shares, total_invested, num_purchases) over purchase prices, skipping NaN."""
+    valid = prices[~np.isnan(prices)]
+    return float(np.sum(amount / valid)), amount * len(valid), len(valid)
+
+
+def simulate_dca(
+    ticker: str,
+    company_name: str,
+    start_date: datetime,
+    end_date: datetime,
+    amount_per_period: float,
+    prices: np.ndarray,
+    current_price: float,
+) -> DCAResult:
+    """
+    Simulate dollar-cost averaging from per-period purchase prices.
+
+    Args:
+        ticker: Stock ticker symbol
+        company_name: Company name
+        start_date: Date of the first purchase
+        end_date: End of the purchase period
+        amount_per_period: Amount invested each period
+        prices: Purchase price for each period (NaN for periods without data, which are skipped)
+        current_price: Price used to value the final position
+
+    Returns:
+        DCAResult with calculated metrics
+    """
+    total_shares, total_invested, num_purchases = _dca_kernel(
+        np.asarray(prices, dtype=np.float64), amount_per_period
+    )
+
+    final_value = total_shares * current_price
+    profit = final_value - total_invested
+    percent_return = (profit / total_invested) * 100 if total_invested > 0 else 0
+    avg_cost = total_invested / total_shares if total_shares > 0 else 0
+
+    return DCAResult(
+        ticker=ticker,
+        company_name=company_name,
+        start_date=start_date,
+        end_date=end_date,
+        amount_per_period=amount_per_period,
+        num_purchases=num_purchases,
+        total_invested=total_invested,
+        total_shares=total_shares,
+        final_value=final_value,
+        profit=profit,
+        percent_return=percent_return,
+        avg_cost_per_share=avg_cost,
+        current_price=current_price,
+    )
@@ -1,9 +1,53 @@
 """Visualization functions for stock data."""
 
 from datetime import datetime
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-import yfinance as yf
+
+from .fetcher import get_prices_batch, StockDataError
+
+
+def _new_chart(save_path: str = None):
+    """Create the figure and axes for a chart."""
+    # Deferred so importing this module doesn't load matplotlib
+    if save_path:
+        # A bare Figure renders with Agg and never touches pyplot or a GUI backend
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(12, 6))
+        return fig, fig.subplots()
+
+    import matplotlib.pyplot as plt
+
+    return plt.subplots(figsize=(12, 6))
+
+
+def _finish_chart(fig, ax, title: str, save_path: str = None):
+    """Label and format a chart, then save it to save_path or show it."""
+    import matplotlib.dates as mdates
+
+    ax.set_title(title)
+    ax.set_xlabel("Date")
+    ax.set_ylabel("Portfolio Value ($)")
+    ax.legend(loc='upper left')
+    ax.grid(True, alpha=0.3)
+
+    # Format x-axis dates
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+    ax.xaxis.set_major_locator(mdates.MonthLocator(interval=3))
+    ax.tick_params(axis='x', labelrotation=45)
+
+    if save_path:
+        # bbox_inches='tight' trims the margins while saving, so no tight_layout pass
+        fig.savefig(save_path, dpi=150, bbox_inches='tight')
+        print(f"Chart saved to {save_path}")
+        return
+
+    import matplotlib.pyplot as plt
+
+    fig.tight_layout()
+    plt.show()
+
+    # Release the figure; pyplot otherwise keeps every chart alive
+    plt.close(fig)
 
 
 def plot_stock_performance(
@@ -23,43 +67,28 @@ def plot_stock_performance(
         initial_amount: Initial investment amount (for normalization)
         save_path: Optional path to save the chart image
     """
-    plt.figure(figsize=(12, 6))
+    try:
+        histories = get_prices_batch(tickers, start_date, end_date)
+    except StockDataError as e:
+        print(f"Error fetching data: {e}")
+        histories = {}
 
-    for ticker in tickers:
-        try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(start=start_date, end=end_date)
+    fig, ax = _new_chart(save_path)
 
-            if hist.empty:
-                print(f"No data for {ticker}")
-                continue
-
-            # Normalize to initial investment
-            initial_price = hist['Close'].iloc[0]
-            normalized = (hist['Close'] / initial_price) * initial_amount
+    for ticker in tickers:
+        hist = histories.get(ticker)
+        if hist is None:
+            print(f"No data for {ticker}")
+            continue
 
-            plt.plot(normalized.index, normalized.values, label=ticker, linewidth=2)
-        except Exception as e:
-            print(f"Error fetching {ticker}: {e}")
+        # Normalize to initial investment
+        initial_price = hist['Close'].iloc[0]
+        normalized = (hist['Close'] / initial_price) * initial_amount
 
-    plt.title(f"Investment Performance: ${initial_amount:,.0f} invested on {start_date.strftime('%Y-%m-%d')}")
-    plt.xlabel("Date")
-    plt.ylabel("Portfolio Value ($)")
-    plt.legend(loc='upper left')
-    plt.grid(True, alpha=0.3)
+        ax.plot(normalized.index, normalized.values, label=ticker, linewidth=2)
 
-    # Format x-axis dates
-    plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-    plt.gca().xaxis.set_major_locator(mdates.MonthLocator(interval=3))
-    plt.xticks(rotation=45)
-
-    plt.tight_layout()
-
-    if save_path:
-        plt.savefig(save_path, dpi=150)
-        print(f"Chart saved to {save_path}")
-    else:
-        plt.show()
+    title = f"Investment Performance: ${initial_amount:,.0f} invested on {start_date.strftime('%Y-%m-%d')}"
+    _finish_chart(fig, ax, title, save_path)
 
 
 def plot_portfolio_comparison(
@@ -77,52 +106,32 @@ def plot_portfolio_comparison(
         end_date: End date
         save_path: Optional path to save
     """
-    plt.figure(figsize=(12, 6))
-
-    for scenario in scenarios:
-        name = scenario['name']
-        holdings = scenario['holdings']
-
-        # Get price data for each holding
-        portfolio_value = None
-
-        for ticker, amount in holdings:
-            try:
-                stock = yf.Ticker(ticker)
-                hist = stock.history(start=start_date, end=end_date)
-
-                if hist.empty:
-                    continue
-
-                initial_price = hist['Close'].iloc[0]
-                shares = amount / initial_price
-                value = hist['Close'] * shares
+    import pandas as pd
 
-                if portfolio_value is None:
-                    portfolio_value = value
-                else:
-                    # Align indices
-                    portfolio_value = portfolio_value.add(value, fill_value=0)
-            except Exception:
-                continue
+    # One batched download covers every holding of every scenario
+    all_tickers = [ticker for scenario in scenarios for ticker, _ in scenario['holdings']]
+    try:
+        histories = get_prices_batch(all_tickers, start_date, end_date)
+    except StockDataError as e:
+        print(f"Error fetching data: {e}")
+        histories = {}
 
-        if portfolio_value is not None:
-            plt.plot(portfolio_value.index, portfolio_value.values, label=name, linewidth=2)
+    fig, ax = _new_chart(save_path)
 
-    plt.title(f"Scenario Comparison ({start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')})")
-    plt.xlabel("Date")
-    plt.ylabel("Portfolio Value ($)")
-    plt.legend(loc='upper left')
-    plt.grid(True, alpha=0.3)
+    for scenario in scenarios:
+        name = scenario['name']
 
-    plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-    plt.gca().xaxis.set_major_locator(mdates.MonthLocator(interval=3))
-    plt.xticks(rotation=45)
+        # Value of each holding over time, skipping tickers without data
+        values = [
+            histories[ticker]['Close'] * (amount / histories[ticker]['Close'].iloc[0])
+            for ticker, amount in scenario['holdings']
+            if ticker in histories
+        ]
 
-    plt.tight_layout()
+        if values:
+            # Sum aligned by date; a holding missing on some day counts as 0
+            portfolio_value = pd.concat(values, axis=1).sum(axis=1)
+            ax.plot(portfolio_value.index, portfolio_value.values, label=name, linewidth=2)
 
-    if save_path:
-        plt.savefig(save_path, dpi=150)
-        print(f"Chart saved to {save_path}")
-    else:
-        plt.show()
+    title = f"Scenario Comparison ({start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')})"
+    _finish_chart(fig, ax, title, save_path)
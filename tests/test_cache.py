@@ -0,0 +1,109 @@
+"""Tests for cache module."""
+
+import hashlib
+import json
+
+import pytest
+
+from src import cache as cache_module
+from src.cache import FileCache
+
+
+class TestFileCache:
+    """Tests for FileCache class."""
+
+    def test_roundtrip(self, tmp_path):
+        """Test a stored value can be read back."""
+        cache = FileCache(tmp_path)
+        cache.set("AAPL", "2020-01-02", {"price": 75.0, "company_name": "Apple Inc."})
+
+        assert cache.get("AAPL", "2020-01-02") == {"price": 75.0, "company_name": "Apple Inc."}
+
+    def test_missing_entry(self, tmp_path):
+        """Test missing entries return None."""
+        cache = FileCache(tmp_path)
+        cache.set("AAPL", "2020-01-02", 75.0)
+
+        assert cache.get("AAPL", "2020-01-03") is None
+        assert cache.get("MSFT", "2020-01-02") is None
+
+    def test_monthly_shards(self, tmp_path):
+        """Test dated entries are grouped into one file per month."""
+        cache = FileCache(tmp_path)
+        cache.set("AAPL", "2020-01-02", 75.0)
+        cache.set("AAPL", "2020-01-03", 74.0)
+        cache.set("AAPL", "2020-02-03", 77.0)
+        cache.set("AAPL", "current", 180.0)
+
+        assert sorted(p.name for p in (tmp_path / "AAPL").iterdir()) == [
+            "2020-01.json", "2020-02.json", "current.json",
+        ]
+        assert cache.get("AAPL", "2020-01-02") == 75.0
+
+    def test_set_many(self, tmp_path):
+        """Test several values are stored across their monthly shards."""
+        cache = FileCache(tmp_path)
+        cache.set("AAPL", "2020-01-02", 70.0)
+        cache.set_many("AAPL", {"2020-01-31": 75.0, "2020-02-03": 77.0})
+
+        assert cache.get("AAPL", "2020-01-02") == 70.0
+        assert cache.get("AAPL", "2020-01-31") == 75.0
+        assert cache.get("AAPL", "2020-02-03") == 77.0
+
+    def test_ttl_expiry(self, tmp_path, monkeypatch):
+        """Test entries older than the TTL are ignored."""
+        cache = FileCache(tmp_path)
+        monkeypatch.setattr(cache_module.time, "time", lambda: 1000.0)
+        cache.set("AAPL", "current", 180.0)
+
+        monkeypatch.setattr(cache_module.time, "time", lambda: 1030.0)
+        assert cache.get("AAPL", "current", ttl=60) == 180.0
+
+        monkeypatch.setattr(cache_module.time, "time", lambda: 1061.0)
+        assert cache.get("AAPL", "current", ttl=60) is None
+
+    def test_corrupt_shard(self, tmp_path):
+        """Test a corrupt shard reads as empty and is replaced on the next write."""
+        cache = FileCache(tmp_path)
+        (tmp_path / "AAPL").mkdir()
+        (tmp_path / "AAPL" / "2020-01.json").write_text('{"2020-01-02": {"timest')
+
+        assert cache.get("AAPL", "2020-01-02") is None
+
+        cache.set("AAPL", "2020-01-03", 74.0)
+        assert cache.get("AAPL", "2020-01-03") == 74.0
+        assert [p.name for p in (tmp_path / "AAPL").iterdir()] == ["2020-01.json"]  # no temp files left
+
+    def test_unsafe_ticker(self, tmp_path):
+        """Test tickers that are not safe directory names are hashed."""
+        cache = FileCache(tmp_path)
+        cache.set("../AAPL", "current", 180.0)
+        cache.set("^GSPC", "current", 4000.0)
+
+        assert cache.get("../AAPL", "current") == 180.0
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            hashlib.md5(b"../AAPL").hexdigest(), "^GSPC",
+        ]
+
+    def test_json_fallback_compatible(self, tmp_path, monkeypatch):
+        """Test shards written with orjson read back without it and vice versa."""
+        orjson = pytest.importorskip("orjson")
+        cache = FileCache(tmp_path)
+
+        def use_orjson():
+            monkeypatch.setattr(cache_module, "_loads", orjson.loads)
+            monkeypatch.setattr(cache_module, "_dumps", orjson.dumps)
+
+        def use_json():
+            monkeypatch.setattr(cache_module, "_loads", json.loads)
+            monkeypatch.setattr(cache_module, "_dumps", lambda obj: json.dumps(obj).encode())
+
+        use_orjson()
+        cache.set("AAPL", "2020-01-02", {"price": 75.0})
+        use_json()
+        assert cache.get("AAPL", "2020-01-02") == {"price": 75.0}
+
+        cache.set("AAPL", "2020-01-03", {"price": 74.0})
+        use_orjson()
+        assert cache.get("AAPL", "2020-01-03") == {"price": 74.0}
+        assert cache.get("AAPL", "2020-01-02") == {"price": 75.0}
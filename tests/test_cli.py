@@ -0,0 +1,150 @@
+"""Tests for cli module."""
+
+import threading
+import time
+import click
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+from datetime import datetime
+from src import cli
+from src.cli import DATE, HOLDING, SCENARIO, TICKER, _simulate_holdings
+
+
+class TestParamTypes:
+    """Tests for the custom Click parameter types."""
+
+    def test_date(self):
+        """Test YYYY-MM-DD dates are parsed, including unpadded ones."""
+        assert DATE.convert("2020-01-05", None, None) == datetime(2020, 1, 5)
+        assert DATE.convert("2020-1-5", None, None) == datetime(2020, 1, 5)
+
+    def test_invalid_date(self):
+        """Test malformed dates are rejected."""
+        with pytest.raises(click.BadParameter):
+            DATE.convert("2020-13-01", None, None)
+
+    @pytest.mark.parametrize("value, expected", [
+        ("aapl", "AAPL"), ("BRK.B", "BRK.B"), ("btc-usd", "BTC-USD"), ("EURUSD=X", "EURUSD=X"), ("^gspc", "^GSPC"),
+    ])
+    def test_ticker(self, value, expected):
+        """Test well-formed tickers are upper-cased, including crypto, currency and index symbols."""
+        assert TICKER.convert(value, None, None) == expected
+
+    @pytest.mark.parametrize("value", ["", "AA PL", "AAPL/B", "-AAPL", "A" * 20])
+    def test_invalid_ticker(self, value):
+        """Test malformed tickers are rejected before any request."""
+        with pytest.raises(click.BadParameter):
+            TICKER.convert(value, None, None)
+
+    def test_holding(self):
+        """Test a holding becomes an upper-case (ticker, amount) tuple."""
+        assert HOLDING.convert("aapl:1000", None, None) == ("AAPL", 1000.0)
+
+    @pytest.mark.parametrize("value", ["AAPL", "AAPL:1:2", "AAPL:abc", "AAPL:-5", "AA PL:100"])
+    def test_invalid_holding(self, value):
+        """Test malformed holdings are rejected."""
+        with pytest.raises(click.BadParameter):
+            HOLDING.convert(value, None, None)
+
+    def test_scenario(self):
+        """Test a scenario becomes a list of holdings."""
+        assert SCENARIO.convert("AAPL:1000, tsla:500", None, None) == [("AAPL", 1000.0), ("TSLA", 500.0)]
+
+
+class TestSimulateHoldings:
+    """Tests for _simulate_holdings function."""
+
+    def test_keeps_holding_order(self, monkeypatch):
+        """Test concurrent name lookups still line up with their holdings."""
+        delays = {"AAPL": 0.05, "MSFT": 0.0}
+
+        def fake_name(ticker):
+            time.sleep(delays[ticker])  # AAPL finishes last
+            return f"{ticker} Inc."
+
+        monkeypatch.setattr(cli, "get_company_name", fake_name)
+
+        results = _simulate_holdings(
+            [("AAPL", 1000.0), ("MSFT", 500.0)],
+            [(100.0, 150.0), (200.0, 100.0)],
+            datetime(2020, 1, 1),
+            datetime(2021, 1, 1),
+        )
+
+        assert [r.company_name for r in results] == ["AAPL Inc.", "MSFT Inc."]
+        assert [r.final_value for r in results] == [1500.0, 250.0]
+
+    def test_duplicate_tickers_looked_up_once(self, monkeypatch):
+        """Test a ticker held twice gets one name lookup, so no two threads share it."""
+        lookups = []
+
+        def fake_name(ticker):
+            lookups.append(ticker)
+            return f"{ticker} Inc."
+
+        monkeypatch.setattr(cli, "get_company_name", fake_name)
+
+        results = _simulate_holdings(
+            [("AAPL", 1000.0), ("AAPL", 500.0)],
+            [(100.0, 150.0), (100.0, 150.0)],
+            datetime(2020, 1, 1),
+            datetime(2021, 1, 1),
+        )
+
+        assert lookups == ["AAPL"]
+        assert [r.company_name for r in results] == ["AAPL Inc.", "AAPL Inc."]
+
+
+class TestBest:
+    """Tests for the best command."""
+
+    def test_names_only_for_shown_rows(self, monkeypatch):
+        """Test company names are only looked up for the top rows, after ranking."""
+        tickers = [f"T{i}" for i in range(10)]
+        buy_prices = {ticker: 100.0 for ticker in tickers}
+        sell_prices = {ticker: 100.0 + i for i, ticker in enumerate(tickers)}
+        lookups = []
+
+        def fake_name(ticker):
+            lookups.append(ticker)
+            return f"{ticker} Inc."
+
+        monkeypatch.setattr(cli, "_fetch_prices", lambda *args: (buy_prices, sell_prices))
+        monkeypatch.setattr(cli, "get_company_name", fake_name)
+
+        result = CliRunner().invoke(
+            cli.cli, ["best", *tickers, "--date", "2020-01-01", "--sell-date", "2021-01-01", "--top", "3"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert sorted(lookups) == ["T7", "T8", "T9"]
+        assert "Best: T9 (T9 Inc.)" in result.output
+
+
+class TestDca:
+    """Tests for the dca command."""
+
+    def test_history_lookups_do_not_overlap(self, monkeypatch):
+        """Test the price series and current price, which share a yf.Ticker, are fetched one after the other."""
+        active = []
+        overlapped = threading.Event()
+
+        def history_call(result):
+            active.append(None)
+            if len(active) > 1:
+                overlapped.set()
+            time.sleep(0.05)
+            active.pop()
+            return result
+
+        closes = pd.Series([100.0, 110.0], index=pd.DatetimeIndex(["2020-01-02", "2020-02-03"]))
+        monkeypatch.setattr(cli, "get_price_series", lambda ticker, start, end: history_call(closes))
+        monkeypatch.setattr(cli, "get_current_price", lambda ticker: history_call(120.0))
+        monkeypatch.setattr(cli, "get_company_name", lambda ticker: f"{ticker} Inc.")
+
+        result = CliRunner().invoke(cli.cli, ["dca", "AAPL", "--date", "2020-01-02", "--end-date", "2020-02-03"])
+
+        assert result.exit_code == 0, result.output
+        assert "AAPL" in result.output
+        assert not overlapped.is_set()
@@ -0,0 +1,316 @@
+"""Tests for fetcher module."""
+
+import pytest
+import pandas as pd
+import yfinance as yf
+from datetime import datetime, timedelta
+from src import fetcher
+from src.cache import FileCache
+from src.fetcher import (
+    closes_on_or_before,
+    get_current_prices_bulk,
+    get_prices_batch,
+    get_stock_prices_bulk,
+    get_stock_price,
+    price_on_or_before,
+    StockDataError,
+)
+
+
+def make_history(closes: dict) -> pd.DataFrame:
+    """Build a price history DataFrame from a {date string: close} dict."""
+    index = pd.DatetimeIndex(list(closes.keys()))
+    return pd.DataFrame({'Close': list(closes.values())}, index=index)
+
+
+class FakeTicker:
+    """Stand-in for yf.Ticker that records how often it is created."""
+
+    created = 0
+
+    def __init__(self, ticker):
+        FakeTicker.created += 1
+        self.info = {'shortName': f"{ticker} Inc."}
+
+    def history(self, start, end):
+        hist = make_history({'2020-01-02': 75.0, '2020-01-03': 74.0})
+        hist.index = hist.index.tz_localize('America/New_York')
+        return hist
+
+
+class TestGetStockPrice:
+    """Tests for get_stock_price function."""
+
+    @pytest.fixture(autouse=True)
+    def fake_yahoo(self, monkeypatch, tmp_path):
+        """Serve FakeTickers with disk misses only, and clear the in-process caches around each test."""
+        monkeypatch.setattr(yf, 'Ticker', FakeTicker)
+        monkeypatch.setattr(fetcher, '_cache', FileCache(tmp_path))
+        monkeypatch.setattr(fetcher._cache, 'get', lambda *args, **kwargs: None)
+        fetcher._get_stock_price.cache_clear()
+        fetcher._get_company_name.cache_clear()
+        fetcher._ticker.cache_clear()
+        FakeTicker.created = 0
+        yield
+        fetcher._get_stock_price.cache_clear()
+        fetcher._get_company_name.cache_clear()
+        fetcher._ticker.cache_clear()
+
+    def test_memoized_per_day(self):
+        """Test repeated lookups for the same day only fetch once."""
+        first = get_stock_price("AAPL", datetime(2020, 1, 3))
+        second = get_stock_price("AAPL", datetime(2020, 1, 3, 15, 30))
+
+        assert first == second == (74.0, "AAPL Inc.")
+        assert FakeTicker.created == 1  # shared by the history and company name lookups
+
+
+class TestGetCompanyName:
+    """Tests for get_company_name function."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self, monkeypatch, tmp_path):
+        """Give each test its own empty disk and in-process cache."""
+        monkeypatch.setattr(fetcher, '_cache', FileCache(tmp_path))
+        fetcher._get_company_name.cache_clear()
+        fetcher._ticker.cache_clear()
+        yield
+        fetcher._get_company_name.cache_clear()
+        fetcher._ticker.cache_clear()
+
+    def test_cached_on_disk(self, monkeypatch):
+        """Test a name is fetched once and then served from the disk cache."""
+        monkeypatch.setattr(yf, 'Ticker', FakeTicker)
+        FakeTicker.created = 0
+
+        assert fetcher.get_company_name("AAPL") == "AAPL Inc."
+        fetcher._get_company_name.cache_clear()  # Simulate a new run
+        assert fetcher.get_company_name("AAPL") == "AAPL Inc."
+        assert FakeTicker.created == 1
+
+    def test_fallback_not_cached(self, monkeypatch):
+        """Test a failed lookup falls back to the ticker without caching or memoizing it."""
+        class BrokenTicker:
+            def __init__(self, ticker):
+                raise RuntimeError("network down")
+
+        monkeypatch.setattr(yf, 'Ticker', BrokenTicker)
+
+        assert fetcher.get_company_name("AAPL") == "AAPL"
+        assert fetcher._cache.get("AAPL", "name") is None
+
+        monkeypatch.setattr(yf, 'Ticker', FakeTicker)  # Network back
+        assert fetcher.get_company_name("AAPL") == "AAPL Inc."
+
+
+class TestPriceOnOrBefore:
+    """Tests for price_on_or_before function."""
+
+    def test_exact_date(self):
+        """Test lookup on a trading day."""
+        hist = make_history({'2020-01-02': 100.0, '2020-01-03': 101.0})
+
+        assert price_on_or_before(hist, "TEST", datetime(2020, 1, 3)) == 101.0
+
+    def test_weekend_uses_previous_close(self):
+        """Test a weekend date falls back to Friday's close."""
+        hist = make_history({'2020-01-03': 101.0, '2020-01-06': 102.0})
+
+        assert price_on_or_before(hist, "TEST", datetime(2020, 1, 5)) == 101.0
+
+    def test_no_prior_data(self):
+        """Test error when the date is before the history starts."""
+        hist = make_history({'2020-01-03': 101.0})
+
+        with pytest.raises(StockDataError):
+            price_on_or_before(hist, "TEST", datetime(2020, 1, 1))
+
+
+class TestClosesOnOrBefore:
+    """Tests for closes_on_or_before function."""
+
+    def test_monthly_lookup(self):
+        """Test each date gets the closest prior close, or NaN when too old."""
+        closes = make_history({
+            '2020-01-02': 100.0,
+            '2020-01-31': 110.0,
+            '2020-02-28': 120.0,
+        })['Close']
+
+        prices = closes_on_or_before(closes, [
+            datetime(2020, 1, 1),   # before history starts
+            datetime(2020, 2, 1),   # Saturday -> Jan 31
+            datetime(2020, 3, 1),   # Sunday -> Feb 28
+            datetime(2020, 4, 1),   # over a week since the last close
+        ])
+
+        assert pd.isna(prices[0])
+        assert prices[1] == 110.0
+        assert prices[2] == 120.0
+        assert pd.isna(prices[3])
+
+
+class TestGetPricesBatch:
+    """Tests for get_prices_batch function."""
+
+    def test_splits_tickers(self, monkeypatch):
+        """Test batched data is split per ticker and empty tickers are dropped."""
+        frames = {
+            'AAPL': make_history({'2020-01-02': 75.0, '2020-01-03': 74.0}),
+            'MSFT': make_history({'2020-01-02': 160.0, '2020-01-03': 158.0}),
+            'BAD': make_history({'2020-01-02': float('nan'), '2020-01-03': float('nan')}),
+        }
+        calls = []
+
+        def fake_download(tickers, **kwargs):
+            calls.append(tickers)
+            return pd.concat({t: frames[t] for t in tickers.split()}, axis=1)
+
+        monkeypatch.setattr(yf, 'download', fake_download)
+
+        histories = get_prices_batch(
+            ['AAPL', 'MSFT', 'BAD', 'AAPL'], datetime(2020, 1, 1), datetime(2020, 1, 4)
+        )
+
+        assert calls == ['AAPL MSFT BAD']
+        assert set(histories) == {'AAPL', 'MSFT'}
+        assert histories['MSFT']['Close'].iloc[-1] == 158.0
+
+    def test_single_download_for_large_requests(self, monkeypatch):
+        """Test all tickers go into one adjusted download with a capped thread count."""
+        calls = []
+
+        def fake_download(tickers, threads, auto_adjust, **kwargs):
+            calls.append((len(tickers.split()), threads, auto_adjust))
+            return pd.concat({t: make_history({'2020-01-02': 1.0}) for t in tickers.split()}, axis=1)
+
+        monkeypatch.setattr(yf, 'download', fake_download)
+
+        tickers = [f"T{i}" for i in range(fetcher.DOWNLOAD_THREADS + 5)]
+        histories = get_prices_batch(tickers, datetime(2020, 1, 1), datetime(2020, 1, 3))
+
+        assert calls == [(len(tickers), fetcher.DOWNLOAD_THREADS, True)]
+        assert len(histories) == len(tickers)
+
+
+class TestBulkPrices:
+    """Tests for get_stock_prices_bulk and get_current_prices_bulk functions."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self, monkeypatch, tmp_path):
+        """Give each test its own empty disk cache."""
+        monkeypatch.setattr(fetcher, '_cache', FileCache(tmp_path))
+
+    def test_stock_prices_on_date(self, monkeypatch):
+        """Test only the week before the date is downloaded and missing tickers are left out."""
+        windows = []
+
+        def fake_download(tickers, start, end, **kwargs):
+            windows.append((start, end))
+            return pd.concat({
+                'AAPL': make_history({'2020-01-02': 75.0, '2020-01-03': 74.0}),
+                'BAD': make_history({'2020-01-02': float('nan'), '2020-01-03': float('nan')}),
+            }, axis=1)
+
+        monkeypatch.setattr(yf, 'download', fake_download)
+
+        prices = get_stock_prices_bulk(['AAPL', 'BAD', 'MISSING'], datetime(2020, 1, 5))
+
+        assert prices == {'AAPL': 74.0}
+        assert windows == [(datetime(2019, 12, 29), datetime(2020, 1, 6))]
+
+    def test_stock_prices_cached(self, monkeypatch):
+        """Test cached tickers are not downloaded again."""
+        calls = []
+
+        def fake_download(tickers, **kwargs):
+            calls.append(tickers)
+            return pd.concat({t: make_history({'2020-01-03': 74.0}) for t in tickers.split()}, axis=1)
+
+        monkeypatch.setattr(yf, 'download', fake_download)
+
+        get_stock_prices_bulk(['AAPL'], datetime(2020, 1, 3))
+        prices = get_stock_prices_bulk(['AAPL', 'MSFT'], datetime(2020, 1, 3))
+
+        assert prices == {'AAPL': 74.0, 'MSFT': 74.0}
+        assert calls == ['AAPL', 'MSFT']
+
+    def test_window_cached_for_nearby_days(self, monkeypatch):
+        """Test one download answers every day from the window's first close to the date."""
+        calls = []
+
+        def fake_download(tickers, **kwargs):
+            calls.append(tickers)
+            return pd.concat({'AAPL': make_history({'2020-01-02': 75.0, '2020-01-03': 74.0})}, axis=1)
+
+        monkeypatch.setattr(yf, 'download', fake_download)
+
+        get_stock_prices_bulk(['AAPL'], datetime(2020, 1, 5))
+
+        assert get_stock_prices_bulk(['AAPL'], datetime(2020, 1, 2)) == {'AAPL': 75.0}
+        assert get_stock_prices_bulk(['AAPL'], datetime(2020, 1, 4)) == {'AAPL': 74.0}
+        assert get_stock_prices_bulk(['AAPL'], datetime(2020, 1, 5)) == {'AAPL': 74.0}
+        assert calls == ['AAPL']
+
+    def test_holiday_served_from_cache(self, monkeypatch):
+        """Test a past holiday, which has no bar on or after it in its window, is cached."""
+        calls = []
+
+        def fake_download(tickers, **kwargs):
+            calls.append(tickers)
+            return pd.concat({'AAPL': make_history({'2019-12-30': 72.0, '2019-12-31': 73.0})}, axis=1)
+
+        monkeypatch.setattr(yf, 'download', fake_download)
+
+        assert get_stock_prices_bulk(['AAPL'], datetime(2020, 1, 1)) == {'AAPL': 73.0}
+        assert get_stock_prices_bulk(['AAPL'], datetime(2020, 1, 1)) == {'AAPL': 73.0}
+        assert calls == ['AAPL']
+
+    def test_recent_days_after_last_bar_not_cached(self, monkeypatch):
+        """Test recent days with no bar on or after them are refetched rather than cached."""
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        last_bar = today - timedelta(days=2)
+        yesterday = today - timedelta(days=1)
+
+        def fake_download(tickers, **kwargs):
+            return pd.concat({'AAPL': make_history({
+                (today - timedelta(days=5)).strftime('%Y-%m-%d'): 70.0,
+                last_bar.strftime('%Y-%m-%d'): 71.0,
+            })}, axis=1)
+
+        monkeypatch.setattr(yf, 'download', fake_download)
+
+        assert get_stock_prices_bulk(['AAPL'], yesterday) == {'AAPL': 71.0}
+        assert fetcher._cache.get('AAPL', last_bar.strftime('%Y-%m-%d')) == {'price': 71.0}
+        assert fetcher._cache.get('AAPL', yesterday.strftime('%Y-%m-%d')) is None
+
+    def test_todays_bar_settles_earlier_days_only(self, monkeypatch):
+        """Test a bar from today caches the days before it but not today."""
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        yesterday = today - timedelta(days=1)
+
+        def fake_download(tickers, **kwargs):
+            return pd.concat({'AAPL': make_history({
+                (today - timedelta(days=3)).strftime('%Y-%m-%d'): 70.0,
+                today.strftime('%Y-%m-%d'): 71.0,
+            })}, axis=1)
+
+        monkeypatch.setattr(yf, 'download', fake_download)
+
+        get_stock_prices_bulk(['AAPL'], today)
+
+        assert fetcher._cache.get('AAPL', yesterday.strftime('%Y-%m-%d')) == {'price': 70.0}
+        assert fetcher._cache.get('AAPL', today.strftime('%Y-%m-%d')) is None
+
+    def test_current_prices(self, monkeypatch):
+        """Test the latest close is used for each ticker."""
+        def fake_download(tickers, period, **kwargs):
+            assert period == '5d'
+            return pd.concat({
+                'AAPL': make_history({'2020-01-02': 75.0, '2020-01-03': 74.0}),
+                'MSFT': make_history({'2020-01-02': 160.0, '2020-01-03': 158.0}),
+            }, axis=1)
+
+        monkeypatch.setattr(yf, 'download', fake_download)
+
+        assert get_current_prices_bulk(['AAPL', 'MSFT']) == {'AAPL': 74.0, 'MSFT': 158.0}
@@ -1,11 +1,15 @@
 """Tests for simulator module."""
 
 import pytest
+from dataclasses import replace
 from datetime import datetime
 from src.simulator import (
+    NUMPY_MIN_SIZE,
     simulate_investment,
+    simulate_investments,
     simulate_portfolio,
     rank_investments,
+    simulate_dca,
     InvestmentResult,
     PortfolioResult,
     RankingResult,
@@ -13,86 +17,106 @@ from src.simulator import (
     DCAResult,
 )
 
+BUY = datetime(2020, 1, 1)
+SELL = datetime(2021, 1, 1)
+SHORT_SELL = datetime(2020, 1, 2)
 
-class TestSimulateInvestment:
-    """Tests for simulate_investment function."""
+# Arguments shared by most simulate_investment calls; override with dict(BASE, ...)
+BASE = dict(buy_date=BUY, sell_date=SELL, buy_price=100.0, investment_amount=1000.0)
 
-    def test_basic_profit(self):
-        """Test basic profitable investment."""
-        result = simulate_investment(
-            ticker="AAPL",
-            company_name="Apple Inc.",
-            buy_date=datetime(2020, 1, 1),
-            buy_price=100.0,
-            sell_date=datetime(2021, 1, 1),
-            sell_price=150.0,
-            investment_amount=1000.0,
-        )
+# Absolute tolerances for dollar/percent amounts and share counts
+TOL = 0.01
+SHARES_TOL = 0.001
 
-        assert result.ticker == "AAPL"
-        assert result.shares == 10.0
-        assert result.final_value == 1500.0
-        assert result.profit == 500.0
-        assert result.percent_return == 50.0
 
-    def test_basic_loss(self):
-        """Test investment with loss."""
-        result = simulate_investment(
-            ticker="TSLA",
-            company_name="Tesla Inc.",
-            buy_date=datetime(2020, 1, 1),
-            buy_price=100.0,
-            sell_date=datetime(2021, 1, 1),
-            sell_price=80.0,
-            investment_amount=1000.0,
-        )
+def make_investment(ticker: str, buy_price: float, sell_price: float, amount: float = 1000.0) -> InvestmentResult:
+    """Simulate a BASE investment, using the ticker as the company name."""
+    return simulate_investment(
+        ticker=ticker,
+        company_name=ticker,
+        sell_price=sell_price,
+        **dict(BASE, buy_price=buy_price, investment_amount=amount),
+    )
 
-        assert result.shares == 10.0
-        assert result.final_value == 800.0
-        assert result.profit == -200.0
-        assert result.percent_return == -20.0
 
-    def test_fractional_shares(self):
-        """Test calculation with fractional shares."""
-        result = simulate_investment(
-            ticker="GOOGL",
-            company_name="Alphabet Inc.",
-            buy_date=datetime(2020, 1, 1),
-            buy_price=150.0,
-            sell_date=datetime(2021, 1, 1),
-            sell_price=200.0,
-            investment_amount=1000.0,
-        )
+@pytest.fixture(scope="session")
+def aapl_50pct():
+    """$1,000 of AAPL bought at $100 and sold a year later at $150."""
+    return simulate_investment(
+        ticker="AAPL",
+        company_name="Apple Inc.",
+        sell_price=150.0,
+        **BASE,
+    )
 
-        assert result.shares == pytest.approx(6.6667, rel=0.01)
-        assert result.final_value == pytest.approx(1333.33, rel=0.01)
 
-    def test_annualized_return_one_year(self):
-        """Test annualized return for exactly one year."""
+@pytest.fixture(scope="session")
+def aapl_50pct_str(aapl_50pct):
+    """The rendered report for aapl_50pct."""
+    return str(aapl_50pct)
+
+
+@pytest.fixture(scope="session")
+def aapl_100pct():
+    """$1,000 of AAPL bought at $100 and sold a year later at $200."""
+    return simulate_investment(
+        ticker="AAPL",
+        company_name="Apple Inc.",
+        sell_price=200.0,
+        **BASE,
+    )
+
+
+@pytest.fixture(scope="session")
+def spy_benchmark():
+    """$1,000 of SPY bought at $100 and sold a year later at $120."""
+    return simulate_investment(
+        ticker="SPY",
+        company_name="S&P 500",
+        sell_price=120.0,
+        **BASE,
+    )
+
+
+class TestSimulateInvestment:
+    """Tests for simulate_investment function."""
+
+    # Exact rows use zero tolerances; only the fractional case is rounded
+    @pytest.mark.parametrize("buy_price, sell_price, shares, final_value, profit, percent_return, shares_tol, tol", [
+        (100.0, 150.0, 10.0, 1500.0, 500.0, 50.0, 0, 0),                  # profit
+        (100.0, 80.0, 10.0, 800.0, -200.0, -20.0, 0, 0),                  # loss
+        (150.0, 200.0, 6.6667, 1333.33, 333.33, 33.33, SHARES_TOL, TOL),  # fractional shares
+    ])
+    def test_investment_math(
+        self, buy_price, sell_price, shares, final_value, profit, percent_return, shares_tol, tol,
+    ):
+        """Test shares, value and returns for profitable, losing and fractional investments."""
         result = simulate_investment(
             ticker="TEST",
             company_name="Test Co",
-            buy_date=datetime(2020, 1, 1),
-            buy_price=100.0,
-            sell_date=datetime(2021, 1, 1),
-            sell_price=150.0,
-            investment_amount=1000.0,
+            sell_price=sell_price,
+            **dict(BASE, buy_price=buy_price),
         )
 
+        assert result.ticker == "TEST"
+        assert result.shares == pytest.approx(shares, abs=shares_tol)
+        assert result.final_value == pytest.approx(final_value, abs=tol)
+        assert result.profit == pytest.approx(profit, abs=tol)
+        assert result.percent_return == pytest.approx(percent_return, abs=tol)
+
+    def test_annualized_return_one_year(self, aapl_50pct):
+        """Test annualized return for exactly one year."""
         # 50% return over ~1 year should be ~50% annualized
-        assert result.annualized_return is not None
-        assert result.annualized_return == pytest.approx(50.0, rel=0.05)
+        assert aapl_50pct.annualized_return is not None
+        assert aapl_50pct.annualized_return == pytest.approx(50.0, abs=0.5)
 
     def test_annualized_return_short_period(self):
         """Test that very short periods don't have annualized return."""
         result = simulate_investment(
             ticker="TEST",
             company_name="Test Co",
-            buy_date=datetime(2020, 1, 1),
-            buy_price=100.0,
-            sell_date=datetime(2020, 1, 2),
             sell_price=101.0,
-            investment_amount=1000.0,
+            **dict(BASE, sell_date=SHORT_SELL),
         )
 
         # 1 day is too short for meaningful annualized return
@@ -103,70 +127,105 @@ class TestSimulateInvestment:
         result = simulate_investment(
             ticker="TEST",
             company_name="Test Co",
-            buy_date=datetime(2020, 1, 1),
-            buy_price=100.0,
-            sell_date=datetime(2020, 1, 1),
             sell_price=100.0,
-            investment_amount=1000.0,
+            **dict(BASE, sell_date=BUY),
         )
 
         assert result.annualized_return is None
 
+    def test_total_loss_annualized(self):
+        """Test a worthless position annualizes to -100%."""
+        result = simulate_investment(
+            ticker="GONE",
+            company_name="Gone Inc.",
+            sell_price=0.0,
+            **dict(BASE, sell_date=datetime(2022, 1, 1)),
+        )
+
+        assert result.annualized_return == -100.0
+
+
+class TestSimulateInvestments:
+    """Tests for simulate_investments function."""
+
+    @pytest.mark.parametrize("sell_date", [SELL, SHORT_SELL])
+    def test_matches_simulate_investment(self, sell_date):
+        """Test batch results equal one-at-a-time results, short periods included."""
+        buy_prices = [100.0, 50.0, 10.0]
+        sell_prices = [150.0, 25.0, 10.0]
+        amounts = [1000.0, 500.0, 250.0]
+
+        results = simulate_investments(
+            tickers=["A", "B", "C"],
+            company_names=["A Inc.", "B Inc.", "C Inc."],
+            buy_date=BUY,
+            buy_prices=buy_prices,
+            sell_date=sell_date,
+            sell_prices=sell_prices,
+            amounts=amounts,
+        )
+
+        expected = [
+            simulate_investment(
+                ticker=ticker,
+                company_name=f"{ticker} Inc.",
+                buy_date=BUY,
+                buy_price=buy_price,
+                sell_date=sell_date,
+                sell_price=sell_price,
+                investment_amount=amount,
+            )
+            for ticker, buy_price, sell_price, amount in zip("ABC", buy_prices, sell_prices, amounts)
+        ]
+        # numpy's vectorized exp/log may differ from math's in the last bit
+        annualized = [r.annualized_return for r in expected]
+        assert [r.annualized_return for r in results] == pytest.approx(annualized)
+        assert [replace(r, annualized_return=None) for r in results] == [
+            replace(r, annualized_return=None) for r in expected
+        ]
+
 
 class TestSimulatePortfolio:
     """Tests for simulate_portfolio function."""
 
-    def test_portfolio_totals(self):
+    def test_portfolio_totals(self, aapl_50pct):
         """Test portfolio calculates correct totals."""
         holdings = [
-            simulate_investment(
-                ticker="AAPL",
-                company_name="Apple",
-                buy_date=datetime(2020, 1, 1),
-                buy_price=100.0,
-                sell_date=datetime(2021, 1, 1),
-                sell_price=150.0,
-                investment_amount=1000.0,
-            ),
-            simulate_investment(
-                ticker="MSFT",
-                company_name="Microsoft",
-                buy_date=datetime(2020, 1, 1),
-                buy_price=200.0,
-                sell_date=datetime(2021, 1, 1),
-                sell_price=250.0,
-                investment_amount=500.0,
-            ),
+            aapl_50pct,
+            make_investment("MSFT", 200.0, 250.0, 500.0),
         ]
 
         result = simulate_portfolio(
             holdings=holdings,
-            buy_date=datetime(2020, 1, 1),
-            sell_date=datetime(2021, 1, 1),
+            buy_date=BUY,
+            sell_date=SELL,
         )
 
         assert result.total_invested == 1500.0
         assert result.total_value == 1500.0 + 625.0  # 1500 + 625 = 2125
         assert result.total_profit == 625.0
 
-    def test_portfolio_percent_return(self):
+    def test_large_portfolio_totals(self):
+        """Test the NumPy path for large portfolios gives the same totals."""
+        holdings = [make_investment(f"T{i}", 100.0, 150.0, 100.0) for i in range(NUMPY_MIN_SIZE * 2)]
+
+        result = simulate_portfolio(
+            holdings=holdings,
+            buy_date=BUY,
+            sell_date=SELL,
+        )
+
+        assert result.total_invested == pytest.approx(100.0 * len(holdings))
+        assert result.total_value == pytest.approx(150.0 * len(holdings))
+
+    def test_portfolio_percent_return(self, aapl_100pct):
         """Test portfolio percent return calculation."""
-        holdings = [
-            simulate_investment(
-                ticker="TEST",
-                company_name="Test",
-                buy_date=datetime(2020, 1, 1),
-                buy_price=100.0,
-                sell_date=datetime(2021, 1, 1),
-                sell_price=200.0,
-                investment_amount=1000.0,
-            ),
-        ]
+        holdings = [aapl_100pct]
 
         result = simulate_portfolio(
             holdings=holdings,
-            buy_date=datetime(2020, 1, 1),
-            sell_date=datetime(2021, 1, 1),
+            buy_date=BUY,
+            sell_date=SELL,
         )
 
         assert result.percent_return == 100.0
@@ -177,155 +236,114 @@ class TestRankInvestments:
 
     def test_ranking_order(self):
         """Test that investments are ranked by return, highest first."""
-        results = [
-            simulate_investment(
-                ticker="LOW",
-                company_name="Low",
-                buy_date=datetime(2020, 1, 1),
-                buy_price=100.0,
-                sell_date=datetime(2021, 1, 1),
-                sell_price=110.0,
-                investment_amount=1000.0,
-            ),
-            simulate_investment(
-                ticker="HIGH",
-                company_name="High",
-                buy_date=datetime(2020, 1, 1),
-                buy_price=100.0,
-                sell_date=datetime(2021, 1, 1),
-                sell_price=200.0,
-                investment_amount=1000.0,
-            ),
-            simulate_investment(
-                ticker="MID",
-                company_name="Mid",
-                buy_date=datetime(2020, 1, 1),
-                buy_price=100.0,
-                sell_date=datetime(2021, 1, 1),
-                sell_price=150.0,
-                investment_amount=1000.0,
-            ),
-        ]
+        results = [make_investment(t, 100.0, p) for t, p in [("LOW", 110.0), ("HIGH", 200.0), ("MID", 150.0)]]
 
         ranked = rank_investments(results)
 
-        assert ranked[0].ticker == "HIGH"
-        assert ranked[1].ticker == "MID"
-        assert ranked[2].ticker == "LOW"
+        assert [r.ticker for r in ranked] == ["HIGH", "MID", "LOW"]
 
     def test_ranking_with_losses(self):
         """Test ranking includes negative returns."""
-        results = [
-            simulate_investment(
-                ticker="LOSS",
-                company_name="Loss",
-                buy_date=datetime(2020, 1, 1),
-                buy_price=100.0,
-                sell_date=datetime(2021, 1, 1),
-                sell_price=50.0,
-                investment_amount=1000.0,
-            ),
-            simulate_investment(
-                ticker="GAIN",
-                company_name="Gain",
-                buy_date=datetime(2020, 1, 1),
-                buy_price=100.0,
-                sell_date=datetime(2021, 1, 1),
-                sell_price=120.0,
-                investment_amount=1000.0,
-            ),
-        ]
+        results = [make_investment(t, 100.0, p) for t, p in [("LOSS", 50.0), ("GAIN", 120.0)]]
 
         ranked = rank_investments(results)
 
-        assert ranked[0].ticker == "GAIN"
-        assert ranked[1].ticker == "LOSS"
+        assert [r.ticker for r in ranked] == ["GAIN", "LOSS"]
         assert ranked[1].percent_return == -50.0
 
+    def test_ranking_ties_keep_order(self):
+        """Test investments with equal returns keep their input order."""
+        results = [make_investment(t, 100.0, p) for t, p in [("A", 120.0), ("B", 150.0), ("C", 120.0)]]
+
+        ranked = rank_investments(results)
+
+        assert [r.ticker for r in ranked] == ["B", "A", "C"]
+
+    def test_large_ranking(self):
+        """Test the NumPy path for large lists sorts the same way, ties included."""
+        results = [make_investment(f"T{i}", 100.0, 100.0 + i % 5) for i in range(NUMPY_MIN_SIZE * 2)]
+
+        ranked = rank_investments(results)
+
+        assert ranked == sorted(results, key=lambda r: r.percent_return, reverse=True)
+
 
 class TestInvestmentResultStr:
     """Tests for InvestmentResult string formatting."""
 
-    def test_str_contains_key_info(self):
+    def test_str_contains_key_info(self, aapl_50pct_str):
         """Test string output contains important information."""
-        result = simulate_investment(
-            ticker="AAPL",
-            company_name="Apple Inc.",
-            buy_date=datetime(2020, 1, 1),
-            buy_price=100.0,
-            sell_date=datetime(2021, 1, 1),
-            sell_price=150.0,
-            investment_amount=1000.0,
-        )
-
-        output = str(result)
-
-        assert "AAPL" in output
-        assert "Apple Inc." in output
-        assert "2020-01-01" in output
-        assert "1,000" in output or "1000" in output
-        assert "50" in output  # percent return
+        assert "AAPL" in aapl_50pct_str
+        assert "Apple Inc." in aapl_50pct_str
+        assert "2020-01-01" in aapl_50pct_str
+        assert "1,000" in aapl_50pct_str or "1000" in aapl_50pct_str
+        assert "50" in aapl_50pct_str  # percent return
 
 
 class TestBenchmarkResult:
     """Tests for BenchmarkResult."""
 
-    def test_beat_market(self):
+    def test_beat_market(self, aapl_100pct, spy_benchmark):
         """Test output when investment beats the market."""
-        investment = simulate_investment(
-            ticker="AAPL",
-            company_name="Apple",
-            buy_date=datetime(2020, 1, 1),
-            buy_price=100.0,
-            sell_date=datetime(2021, 1, 1),
-            sell_price=200.0,
-            investment_amount=1000.0,
-        )
-
-        benchmark = simulate_investment(
-            ticker="SPY",
-            company_name="S&P 500",
-            buy_date=datetime(2020, 1, 1),
-            buy_price=100.0,
-            sell_date=datetime(2021, 1, 1),
-            sell_price=120.0,
-            investment_amount=1000.0,
-        )
-
-        result = BenchmarkResult(investment=investment, benchmark=benchmark)
+        result = BenchmarkResult(investment=aapl_100pct, benchmark=spy_benchmark)
         output = str(result)
 
         assert "BEAT" in output
         assert "80" in output  # difference is 80%
 
-    def test_underperform_market(self):
+    def test_underperform_market(self, spy_benchmark):
         """Test output when investment underperforms the market."""
         investment = simulate_investment(
             ticker="FAIL",
             company_name="Fail Co",
-            buy_date=datetime(2020, 1, 1),
-            buy_price=100.0,
-            sell_date=datetime(2021, 1, 1),
             sell_price=105.0,
-            investment_amount=1000.0,
+            **BASE,
         )
 
-        benchmark = simulate_investment(
-            ticker="SPY",
-            company_name="S&P 500",
-            buy_date=datetime(2020, 1, 1),
-            buy_price=100.0,
-            sell_date=datetime(2021, 1, 1),
-            sell_price=120.0,
-            investment_amount=1000.0,
-        )
-
-        result = BenchmarkResult(investment=investment, benchmark=benchmark)
+        result = BenchmarkResult(investment=investment, benchmark=spy_benchmark)
         output = str(result)
 
         assert "UNDERPERFORMED" in output
 
 
+class TestSimulateDCA:
+    """Tests for simulate_dca function."""
+
+    def test_dca_totals(self):
+        """Test DCA accumulates shares across purchases."""
+        result = simulate_dca(
+            ticker="AAPL",
+            company_name="Apple Inc.",
+            start_date=datetime(2020, 1, 1),
+            end_date=datetime(2020, 3, 1),
+            amount_per_period=100.0,
+            prices=[50.0, 100.0, 200.0],
+            current_price=100.0,
+        )
+
+        assert result.num_purchases == 3
+        assert result.total_invested == 300.0
+        assert result.total_shares == pytest.approx(3.5)
+        assert result.final_value == pytest.approx(350.0)
+        assert result.avg_cost_per_share == pytest.approx(300.0 / 3.5)
+
+    def test_dca_skips_missing_prices(self):
+        """Test periods without a price are skipped."""
+        result = simulate_dca(
+            ticker="AAPL",
+            company_name="Apple Inc.",
+            start_date=datetime(2020, 1, 1),
+            end_date=datetime(2020, 3, 1),
+            amount_per_period=100.0,
+            prices=[float('nan'), 100.0, 100.0],
+            current_price=150.0,
+        )
+
+        assert result.num_purchases == 2
+        assert result.total_invested == 200.0
+        assert result.percent_return == pytest.approx(50.0)
+
+
 class TestDCAResult:
     """Tests for DCAResult."""
 
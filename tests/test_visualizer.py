@@ -0,0 +1,85 @@
+"""Tests for visualizer module."""
+
+import sys
+
+import pytest
+from datetime import datetime
+from src import visualizer
+from src.visualizer import plot_portfolio_comparison, plot_stock_performance
+from tests.test_fetcher import make_history
+
+
+HISTORIES = {
+    'AAPL': make_history({'2020-01-02': 100.0, '2020-01-03': 110.0, '2020-01-06': 120.0}),
+    'MSFT': make_history({'2020-01-02': 200.0, '2020-01-06': 150.0}),
+}
+
+
+@pytest.fixture
+def charts(monkeypatch):
+    """Serve HISTORIES for every batch download and collect the axes of each chart drawn."""
+    axes = []
+    new_chart = visualizer._new_chart
+
+    def recording_new_chart(save_path=None):
+        fig, ax = new_chart(save_path)
+        axes.append(ax)
+        return fig, ax
+
+    def fake_batch(tickers, start, end):
+        return {ticker: HISTORIES[ticker] for ticker in tickers if ticker in HISTORIES}
+
+    monkeypatch.setattr(visualizer, '_new_chart', recording_new_chart)
+    monkeypatch.setattr(visualizer, 'get_prices_batch', fake_batch)
+    return axes
+
+
+class TestPlotStockPerformance:
+    """Tests for plot_stock_performance function."""
+
+    def test_skips_tickers_without_data(self, charts, tmp_path, capsys):
+        """Test each ticker with data gets a normalized line and the rest are reported."""
+        save_path = tmp_path / "x.png"
+
+        plot_stock_performance(
+            ['AAPL', 'BAD', 'MSFT'], datetime(2020, 1, 1), datetime(2020, 1, 7), 1000.0, save_path=save_path,
+        )
+
+        lines = charts[0].get_lines()
+        assert [line.get_label() for line in lines] == ['AAPL', 'MSFT']
+        assert list(lines[0].get_ydata()) == [1000.0, 1100.0, 1200.0]
+        assert "No data for BAD" in capsys.readouterr().out
+        assert save_path.exists()
+
+
+class TestPlotPortfolioComparison:
+    """Tests for plot_portfolio_comparison function."""
+
+    def test_scenario_sums_holdings(self, charts, tmp_path):
+        """Test a scenario's line is the date-aligned sum of its holdings, skipping tickers without data."""
+        scenarios = [
+            {'name': 'Mixed', 'holdings': [('AAPL', 1000.0), ('MSFT', 500.0), ('BAD', 250.0)]},
+            {'name': 'Missing', 'holdings': [('BAD', 1000.0)]},
+        ]
+
+        plot_portfolio_comparison(scenarios, datetime(2020, 1, 1), datetime(2020, 1, 7), save_path=tmp_path / "x.png")
+
+        lines = charts[0].get_lines()
+        assert [line.get_label() for line in lines] == ['Mixed']
+        # MSFT has no close on 2020-01-03, so only AAPL counts that day
+        assert list(lines[0].get_ydata()) == [1000.0 + 500.0, 1100.0, 1200.0 + 375.0]
+
+    def test_save_path_skips_pyplot(self, monkeypatch, tmp_path):
+        """Test saving a chart renders without importing matplotlib.pyplot."""
+        monkeypatch.setattr(visualizer, 'get_prices_batch', lambda tickers, start, end: HISTORIES)
+        monkeypatch.delitem(sys.modules, 'matplotlib.pyplot', raising=False)
+
+        plot_portfolio_comparison(
+            [{'name': 'AAPL', 'holdings': [('AAPL', 1000.0)]}],
+            datetime(2020, 1, 1),
+            datetime(2020, 1, 7),
+            save_path=tmp_path / "x.png",
+        )
+
+        assert (tmp_path / "x.png").exists()
+        assert 'matplotlib.pyplot' not in sys.modules